@@ -11,6 +11,7 @@ Security features:
 - Secure logging (no password leaks)
 """
 
+import asyncio
 import os
 import sys
 import secrets
@@ -81,6 +82,7 @@ except ImportError as e:
 
 def put_secret(sub: str, profile: str, payload: Dict[str, str]):
     """Store credentials for a user profile."""
+    _evict_boomi_clients(sub, profile)
     secrets_backend.put_secret(sub, profile, payload)
     # Log without password
     print(f"[INFO] Stored credentials for {sub}:{profile} (username: {payload.get('username', '')[:10]}***)")
@@ -98,6 +100,7 @@ def list_profiles(sub: str):
 
 def delete_profile(sub: str, profile: str):
     """Delete a user profile."""
+    _evict_boomi_clients(sub, profile)
     secrets_backend.delete_profile(sub, profile)
 
 
@@ -223,6 +226,63 @@ def get_user_subject() -> str:
     return subject
 
 
+# --- Helper: reuse Boomi SDK clients per credential set ---
+from boomi_mcp.utils.caching import GenericCache
+
+# Building a Boomi client instantiates every API service, so keep one per
+# credential set instead of rebuilding it on every tool call. The cache is
+# bounded and entries expire, so clients holding replaced passwords do not
+# stay in memory for the life of the process.
+_SDK_CLIENT_TTL = 3600
+_SDK_CLIENT_MAX = 64
+
+# credential key -> {(base_url, timeout): Boomi}
+_sdk_clients = GenericCache(ttl_seconds=_SDK_CLIENT_TTL, max_size=_SDK_CLIENT_MAX)
+
+
+def _credential_key(creds: Dict[str, str]) -> tuple:
+    """Cache key for a credential set (the password only as a digest)."""
+    password_digest = hashlib.sha256(creds["password"].encode()).hexdigest()
+    return (creds["account_id"], creds["username"], password_digest)
+
+
+def _evict_boomi_clients(sub: str, profile: str) -> None:
+    """Drop cached SDK clients built from a profile's currently stored credentials."""
+    try:
+        creds = secrets_backend.get_secret(sub, profile)
+    except Exception:
+        # Nothing stored for this profile yet
+        return
+    _sdk_clients.remove(_credential_key(creds))
+
+
+def get_boomi_client(
+    creds: Dict[str, str],
+    timeout: Optional[int] = None,
+    base_url: Optional[str] = None
+) -> "Boomi":
+    """Return a cached Boomi SDK client for the given credentials."""
+    cred_key = _credential_key(creds)
+    clients = _sdk_clients.get(cred_key)
+    if clients is None:
+        clients = {}
+        _sdk_clients.set(cred_key, clients)
+    sdk = clients.get((base_url, timeout))
+    if sdk is None:
+        sdk_params = {
+            "account_id": creds["account_id"],
+            "username": creds["username"],
+            "password": creds["password"],
+        }
+        if timeout is not None:
+            sdk_params["timeout"] = timeout
+        # Only add base_url if explicitly provided (not None)
+        if base_url:
+            sdk_params["base_url"] = base_url
+        sdk = clients[(base_url, timeout)] = Boomi(**sdk_params)
+    return sdk
+
+
 # --- Tools ---
 # Note: Credential management is done via web UI at /
 # The following tools are commented out to avoid confusion
@@ -362,18 +422,11 @@ def boomi_account_info(profile: str):
 
     # Initialize Boomi SDK (matches sample.py - no base_url unless explicitly provided)
     try:
-        sdk_params = {
-            "account_id": creds["account_id"],
-            "username": creds["username"],
-            "password": creds["password"],
-            "timeout": 30000,  # 30 seconds (SDK uses milliseconds)
-        }
-
-        # Only add base_url if explicitly provided (not None)
-        if creds.get("base_url"):
-            sdk_params["base_url"] = creds["base_url"]
-
-        sdk = Boomi(**sdk_params)
+        sdk = get_boomi_client(
+            creds,
+            timeout=30000,  # 30 seconds (SDK uses milliseconds)
+            base_url=creds.get("base_url")
+        )
 
         # Call the same endpoint the sample demonstrates
         result = sdk.account.get_account(id_=creds["account_id"])
@@ -408,7 +461,7 @@ def boomi_account_info(profile: str):
 # --- Trading Partner MCP Tools ---
 if manage_trading_partner_action:
     @mcp.tool()
-    def manage_trading_partner(
+    async def manage_trading_partner(
         profile: str,
         action: str,
         partner_id: str = None,
@@ -597,7 +650,9 @@ if manage_trading_partner_action:
         odette_syntax_version: str = None,
         odette_test_indicator: str = None,
         # Organization linking
-        organization_id: str = None
+        organization_id: str = None,
+        # Usage analysis
+        limit: int = None
     ):
         """
         Manage B2B/EDI trading partners (all 7 standards).
@@ -615,6 +670,8 @@ if manage_trading_partner_action:
             classification: Partner classification (optional for create/list)
                            Options: tradingpartner, mycompany
             folder_name: Folder to place partner in (optional for create/list)
+            limit: Maximum number of referencing components to return (optional for analyze_usage).
+                   total_references and can_safely_delete always cover every reference.
 
             # Standard-specific fields (X12, EDIFACT, HL7, RosettaNet, TRADACOMS, ODETTE)
             isa_id: ISA ID for X12 partners (X12 only)
@@ -735,16 +792,6 @@ if manage_trading_partner_action:
             subject = get_user_subject()
             print(f"[INFO] manage_trading_partner called by user: {subject}, profile: {profile}, action: {action}")
 
-            # Get credentials
-            creds = get_secret(subject, profile)
-
-            # Initialize Boomi SDK
-            sdk = Boomi(
-                account_id=creds["account_id"],
-                username=creds["username"],
-                password=creds["password"]
-            )
-
             # Build parameters based on action
             params = {}
 
@@ -1521,9 +1568,18 @@ if manage_trading_partner_action:
 
             elif action == "analyze_usage":
                 params["partner_id"] = partner_id
+                if limit is not None:
+                    params["limit"] = limit
+
+            # Credential lookup, client construction and the SDK call all block on
+            # network I/O, so they run together in a worker thread
+            def run_action():
+                creds = get_secret(subject, profile)
+                sdk = get_boomi_client(creds)
+                return manage_trading_partner_action(sdk, profile, action, **params)
 
             # Route to appropriate function
-            return manage_trading_partner_action(sdk, profile, action, **params)
+            return await asyncio.to_thread(run_action)
 
         except Exception as e:
             print(f"[ERROR] Failed to {action} trading partner: {e}")
@@ -1647,11 +1703,7 @@ if manage_process_action:
             creds = get_secret(subject, profile)
 
             # Initialize Boomi SDK
-            sdk = Boomi(
-                account_id=creds["account_id"],
-                username=creds["username"],
-                password=creds["password"]
-            )
+            sdk = get_boomi_client(creds)
 
             # Build parameters based on action
             params = {}
@@ -1767,11 +1819,7 @@ if manage_organization_action:
             creds = get_secret(subject, profile)
 
             # Initialize Boomi SDK
-            sdk = Boomi(
-                account_id=creds["account_id"],
-                username=creds["username"],
-                password=creds["password"]
-            )
+            sdk = get_boomi_client(creds)
 
             # Build parameters based on action
             params = {}
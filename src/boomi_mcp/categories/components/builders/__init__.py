@@ -44,6 +44,7 @@ from .communication import (
     OFTPProtocolBuilder,
     SFTPProtocolBuilder,
     build_communication_xml,
+    build_communication_xml_normalized,
     get_supported_protocols,
     PROTOCOL_BUILDERS
 )
@@ -103,6 +104,7 @@ __all__ = [
     "OFTPProtocolBuilder",
     "SFTPProtocolBuilder",
     "build_communication_xml",
+    "build_communication_xml_normalized",
     "get_supported_protocols",
     "PROTOCOL_BUILDERS",
 
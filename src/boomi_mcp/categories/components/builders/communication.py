@@ -6,7 +6,8 @@ These builders generate CommunicationOption XML for various protocols
 types that support communication protocols.
 """
 
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from .base_builder import BaseXMLBuilder
 
 
@@ -368,8 +369,22 @@ PROTOCOL_BUILDERS: Dict[str, type] = {
     "sftp": SFTPProtocolBuilder,
 }
 
+# Lowercased protocol names build_communication_xml accepts; others are skipped
+_KNOWN_PROTOCOLS = frozenset(PROTOCOL_BUILDERS)
 
-def build_communication_xml(protocols: Optional[List[str]] = None, **settings) -> str:
+# Returned when no supported protocol is requested
+_EMPTY_COMM_OPTIONS = "<CommunicationOptions />"
+
+# Opening and closing of a non-empty CommunicationOptions block
+_COMM_OPTIONS_HEADER = "<CommunicationOptions>\n"
+_COMM_OPTIONS_FOOTER = "\n          </CommunicationOptions>"
+
+# Default CommunicationOption XML per protocol, built the first time the protocol
+# is requested. The strings are immutable, so every later call shares them.
+_PROTOCOL_OPTIONS: Dict[str, str] = {}
+
+
+def build_communication_xml(protocols: Optional[Iterable[str]] = None, **settings) -> str:
     """
     Build CommunicationOptions XML for multiple protocols.
 
@@ -377,8 +392,9 @@ def build_communication_xml(protocols: Optional[List[str]] = None, **settings) -
     communication protocols (trading partners, processes, etc.).
 
     Args:
-        protocols: List of protocol names (e.g., ['ftp', 'http', 'as2'])
-                  If None or empty, returns empty CommunicationOptions
+        protocols: Protocol names (e.g., ['ftp', 'http', 'as2']); any iterable,
+                  consumed once. If None or empty, returns empty CommunicationOptions.
+                  Names are case-insensitive; repeats are emitted once.
         **settings: Protocol-specific settings (reserved for future use)
 
     Returns:
@@ -389,24 +405,71 @@ def build_communication_xml(protocols: Optional[List[str]] = None, **settings) -
         >>> # Returns CommunicationOptions with FTP and HTTP configured
     """
     if not protocols:
-        return "<CommunicationOptions />"
+        return _EMPTY_COMM_OPTIONS
 
-    options = []
+    # Each supported protocol is emitted once, in first-seen order, so repeated names
+    # cannot produce duplicate default CommunicationOption blocks. Unsupported
+    # names are dropped here, before they reach the cache key.
+    unique_protocols: Dict[str, str] = {}
     for protocol_name in protocols:
         protocol_key = protocol_name.lower()
-        builder_class = PROTOCOL_BUILDERS.get(protocol_key)
+        if protocol_key in _KNOWN_PROTOCOLS:
+            unique_protocols.setdefault(protocol_key, protocol_name)
+
+    # Without settings the block depends only on the protocol list, so reuse it
+    if not settings:
+        return _build_default_communication_xml(tuple(unique_protocols))
+
+    options = []
+    for protocol_key, protocol_name in unique_protocols.items():
+        protocol_settings = settings.get(protocol_name)
+        if protocol_settings:
+            options.append(PROTOCOL_BUILDERS[protocol_key]().build(**protocol_settings))
+        else:
+            options.append(_default_option(protocol_key))
+
+    return _wrap_communication_options(options)
+
+
+def build_communication_xml_normalized(protocol_keys: Tuple[str, ...]) -> str:
+    """
+    Build default CommunicationOptions XML for already-normalized protocol names.
+
+    Fast path for callers whose names are already lowercase and unique (e.g.
+    parsed from config): skips the per-name lower() pass of build_communication_xml.
+    Unsupported names are skipped; protocol settings are not applied.
+
+    Args:
+        protocol_keys: Lowercase, de-duplicated protocol names in output order
+
+    Returns:
+        CommunicationOptions XML string
+    """
+    return _build_default_communication_xml(
+        tuple(key for key in protocol_keys if key in _KNOWN_PROTOCOLS)
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_default_communication_xml(protocol_keys: Tuple[str, ...]) -> str:
+    """CommunicationOptions XML of the default options for supported lowercased protocol names, cached."""
+    return _wrap_communication_options([_default_option(key) for key in protocol_keys])
+
+
+def _default_option(protocol_key: str) -> str:
+    """Default CommunicationOption XML for a supported protocol, built on first use."""
+    option = _PROTOCOL_OPTIONS.get(protocol_key)
+    if option is None:
+        option = _PROTOCOL_OPTIONS[protocol_key] = PROTOCOL_BUILDERS[protocol_key]().build()
+    return option
 
-        if builder_class:
-            builder = builder_class()
-            protocol_settings = settings.get(protocol_name, {})
-            options.append(builder.build(**protocol_settings))
 
+def _wrap_communication_options(options: List[str]) -> str:
+    """Wrap CommunicationOption blocks in a CommunicationOptions element."""
     if not options:
-        return "<CommunicationOptions />"
+        return _EMPTY_COMM_OPTIONS
 
-    return f'''<CommunicationOptions>
-{chr(10).join(options)}
-          </CommunicationOptions>'''
+    return _COMM_OPTIONS_HEADER + "\n".join(options) + _COMM_OPTIONS_FOOTER
 
 
 def get_supported_protocols() -> List[str]:
@@ -16,7 +16,13 @@ Supported Standards:
 """
 
 from typing import Dict, Any, List, Optional
+import asyncio
+import copy
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import attrgetter
 from datetime import datetime
 import xml.etree.ElementTree as ET
 
@@ -24,11 +30,300 @@ import xml.etree.ElementTree as ET
 from boomi.models import (
     TradingPartnerComponentQueryConfig,
     TradingPartnerComponentQueryConfigQueryFilter,
+    TradingPartnerComponentGroupingExpression,
+    TradingPartnerComponentGroupingExpressionOperator,
     TradingPartnerComponentSimpleExpression,
     TradingPartnerComponentSimpleExpressionOperator,
-    TradingPartnerComponentSimpleExpressionProperty
+    TradingPartnerComponentSimpleExpressionProperty,
+    TradingPartnerComponentClassification,
+    ComponentReferenceQueryConfig,
+    ComponentReferenceQueryConfigQueryFilter,
+    ComponentReferenceSimpleExpression,
+    ComponentReferenceSimpleExpressionOperator,
+    ComponentReferenceSimpleExpressionProperty
 )
 
+from ...models.trading_partner_builders import (
+    build_trading_partner_model,
+    build_contact_info,
+    build_as2_communication_options,
+    build_http_communication_options,
+    build_sftp_communication_options,
+    build_ftp_communication_options,
+    build_disk_communication_options,
+    build_mllp_communication_options,
+    build_oftp_communication_options,
+    PartnerCommunicationDict
+)
+from ...utils.caching import GenericCache
+
+
+# Attribute names the SDK models have used for the component id, in lookup order
+_ID_KEYS = ('id_', 'id', 'component_id')
+
+
+# Upper bound on entries held by each module-level cache below
+_CACHE_MAX_SIZE = 256
+
+# Short-lived cache of get_trading_partner responses to collapse bursts of identical reads
+_TP_CACHE = GenericCache(ttl_seconds=5, max_size=_CACHE_MAX_SIZE)
+
+# Recently fetched SDK models, so repeated get / analyze_usage calls skip the re-fetch.
+# Read-only views: update_trading_partner always fetches fresh before writing back.
+_TP_MODEL_CACHE = GenericCache(ttl_seconds=60, max_size=_CACHE_MAX_SIZE)
+_COMPONENT_CACHE = GenericCache(ttl_seconds=60, max_size=_CACHE_MAX_SIZE)
+
+# Error text of recent 404s in update_trading_partner, so retries with a stale id skip the API
+_TP_NOT_FOUND_CACHE = GenericCache(ttl_seconds=10, max_size=_CACHE_MAX_SIZE)
+
+# Query expression enums, resolved once
+_OP_EQUALS = TradingPartnerComponentSimpleExpressionOperator.EQUALS
+_OP_LIKE = TradingPartnerComponentSimpleExpressionOperator.LIKE
+_PROP_STANDARD = TradingPartnerComponentSimpleExpressionProperty.STANDARD
+_PROP_CLASSIFICATION = TradingPartnerComponentSimpleExpressionProperty.CLASSIFICATION
+_PROP_NAME = TradingPartnerComponentSimpleExpressionProperty.NAME
+
+# Standards always reported in the list_trading_partners summary
+_SUMMARY_STANDARDS = ('x12', 'edifact', 'hl7', 'custom', 'rosettanet', 'tradacoms', 'odette')
+
+# Container types produced by SDK _map() serialization
+_MAPPED_CONTAINERS = (dict, list)
+
+# Lowercased classification strings accepted by update_trading_partner (anything else is a trading partner)
+_CLASSIFICATION_MAP = {
+    "mycompany": TradingPartnerComponentClassification.MYCOMPANY,
+    "tradingpartner": TradingPartnerComponentClassification.TRADINGPARTNER,
+}
+
+# Flat contact_* parameters understood by build_contact_info
+_CONTACT_KEYS = frozenset({
+    'contact_name', 'contact_email', 'contact_phone', 'contact_fax',
+    'contact_address', 'contact_address2', 'contact_city', 'contact_state',
+    'contact_country', 'contact_postalcode'
+})
+
+# Upper bound on concurrent parent-component lookups in analyze_trading_partner_usage
+_MAX_REFERENCE_WORKERS = 16
+
+# Caveat attached to every usage analysis result
+_USAGE_NOTE = "Shows immediate references (one level). UI's 'Show Where Used' does recursive tracing."
+
+# Partners submitted per bulk create batch, and how many create calls run at once
+BULK_CHUNK = 100
+_BULK_CREATE_WORKERS = 4
+
+# (parent_component_id, parent_version) of a ComponentReference entry
+_get_parent_ref = attrgetter('parent_component_id', 'parent_version')
+
+# Maximum characters of exception text echoed back from a failed create
+_MAX_ERROR_TEXT = 500
+
+# ContactInfo output key -> SDK model attribute
+_CONTACT_FIELDS = (
+    ('name', 'contact_name'),
+    ('email', 'email'),
+    ('phone', 'phone'),
+    ('address1', 'address1'),
+    ('address2', 'address2'),
+    ('city', 'city'),
+    ('state', 'state'),
+    ('country', 'country'),
+    ('postalcode', 'postalcode'),
+    ('fax', 'fax'),
+)
+
+
+# Communication protocol parse table:
+# (protocol, PartnerCommunication attribute, keep None values, ((output key, attribute path), ...))
+_PROTOCOL_SPECS = (
+    ('disk', 'disk_communication_options', True, (
+        ('get_directory', ('disk_get_options', 'get_directory')),
+        ('file_filter', ('disk_get_options', 'file_filter')),
+        ('send_directory', ('disk_send_options', 'send_directory')),
+    )),
+    ('ftp', 'ftp_communication_options', False, (
+        ('host', ('ftp_settings', 'host')),
+        ('port', ('ftp_settings', 'port')),
+        ('user', ('ftp_settings', 'user')),
+        ('connection_mode', ('ftp_settings', 'connection_mode')),
+        ('ssl_mode', ('ftp_settings', 'ftpssl_options', 'sslmode')),
+        ('use_client_authentication', ('ftp_settings', 'ftpssl_options', 'use_client_authentication')),
+        ('remote_directory', ('ftp_get_options', 'remote_directory')),
+    )),
+    ('sftp', 'sftp_communication_options', False, (
+        ('host', ('sftp_settings', 'host')),
+        ('port', ('sftp_settings', 'port')),
+        ('user', ('sftp_settings', 'user')),
+        ('ssh_key_auth', ('sftp_settings', 'sftpssh_options', 'sshkeyauth')),
+        ('known_host_entry', ('sftp_settings', 'sftpssh_options', 'known_host_entry')),
+        ('ssh_key_path', ('sftp_settings', 'sftpssh_options', 'sshkeypath')),
+        ('proxy_host', ('sftp_settings', 'sftp_proxy_settings', 'host')),
+        ('proxy_port', ('sftp_settings', 'sftp_proxy_settings', 'port')),
+        ('proxy_type', ('sftp_settings', 'sftp_proxy_settings', 'type_')),
+        ('remote_directory', ('sftp_get_options', 'remote_directory')),
+    )),
+    ('http', 'http_communication_options', False, (
+        ('url', ('http_settings', 'url')),
+        ('authentication_type', ('http_settings', 'authentication_type')),
+        ('connect_timeout', ('http_settings', 'connect_timeout')),
+        ('read_timeout', ('http_settings', 'read_timeout')),
+        ('username', ('http_settings', 'http_auth_settings', 'user')),
+        ('client_auth', ('http_settings', 'httpssl_options', 'clientauth')),
+        ('trust_server_cert', ('http_settings', 'httpssl_options', 'trust_server_cert')),
+        ('method_type', ('http_send_options', 'method_type')),
+        ('data_content_type', ('http_send_options', 'data_content_type')),
+        ('follow_redirects', ('http_send_options', 'follow_redirects')),
+        ('return_errors', ('http_send_options', 'return_errors')),
+    )),
+    ('as2', 'as2_communication_options', False, (
+        ('url', ('as2_send_settings', 'url')),
+        ('authentication_type', ('as2_send_settings', 'authentication_type')),
+        ('verify_hostname', ('as2_send_settings', 'verify_hostname')),
+        ('username', ('as2_send_settings', 'auth_settings', 'username')),
+        ('as2_partner_id', ('as2_send_options', 'as2_partner_info', 'as2_id')),
+        ('signed', ('as2_send_options', 'as2_message_options', 'signed')),
+        ('encrypted', ('as2_send_options', 'as2_message_options', 'encrypted')),
+        ('compressed', ('as2_send_options', 'as2_message_options', 'compressed')),
+        ('encryption_algorithm', ('as2_send_options', 'as2_message_options', 'encryption_algorithm')),
+        ('signing_digest_alg', ('as2_send_options', 'as2_message_options', 'signing_digest_alg')),
+        ('request_mdn', ('as2_send_options', 'as2_mdn_options', 'request_mdn')),
+        ('mdn_signed', ('as2_send_options', 'as2_mdn_options', 'signed')),
+        ('synchronous_mdn', ('as2_send_options', 'as2_mdn_options', 'synchronous')),
+    )),
+    ('mllp', 'mllp_communication_options', False, (
+        ('host', ('mllp_send_settings', 'host')),
+        ('port', ('mllp_send_settings', 'port')),
+        ('persistent', ('mllp_send_settings', 'persistent')),
+        ('receive_timeout', ('mllp_send_settings', 'receive_timeout')),
+        ('send_timeout', ('mllp_send_settings', 'send_timeout')),
+        ('max_connections', ('mllp_send_settings', 'max_connections')),
+        ('inactivity_timeout', ('mllp_send_settings', 'inactivity_timeout')),
+        ('max_retry', ('mllp_send_settings', 'max_retry')),
+        ('use_ssl', ('mllp_send_settings', 'mllpssl_options', 'use_ssl')),
+        ('use_client_ssl', ('mllp_send_settings', 'mllpssl_options', 'use_client_ssl')),
+        ('client_ssl_alias', ('mllp_send_settings', 'mllpssl_options', 'client_ssl_alias')),
+        ('ssl_alias', ('mllp_send_settings', 'mllpssl_options', 'ssl_alias')),
+    )),
+)
+
+# OFTP connection fields: (output key, attribute, fall back to defaults when falsy).
+# Fields without the falsy fallback only use defaults when the attribute is absent.
+_OFTP_FIELDS = (
+    ('host', 'host', True),
+    ('port', 'port', True),
+    ('tls', 'tls', False),
+    ('ssid_auth', 'ssidauth', False),
+    ('sfid_cipher', 'sfidciph', False),
+    ('use_gateway', 'use_gateway', False),
+    ('use_client_ssl', 'use_client_ssl', False),
+    ('client_ssl_alias', 'client_ssl_alias', True),
+)
+
+_MISSING = object()
+
+
+def _parse_protocol_options(protocol: str, options, keep_none: bool, fields) -> Dict[str, Any]:
+    """Flatten one protocol's SDK communication options using a _PROTOCOL_SPECS field table."""
+    info = {"protocol": protocol}
+    for out_key, path in fields:
+        node = options
+        for attr in path[:-1]:
+            node = getattr(node, attr, None)
+            if not node:
+                break
+        else:
+            value = getattr(node, path[-1], None)
+            if keep_none or value is not None:
+                info[out_key] = value
+    return info
+
+
+def _cache_key(boomi_client, component_id: str) -> str:
+    """Cache key scoped to the client's account (its service base URL) and component."""
+    service = getattr(boomi_client, 'trading_partner_component', None) or boomi_client.component
+    base_url = getattr(service, 'base_url', None)
+    return f"{base_url}:{component_id}"
+
+
+def _get_trading_partner_model(boomi_client, component_id: str):
+    """
+    Fetch a TradingPartnerComponent model for reading, reusing a recent fetch when available.
+
+    Not for read-modify-write: the cached model may be up to a minute old.
+    """
+    key = _cache_key(boomi_client, component_id)
+    model = _TP_MODEL_CACHE.get(key)
+    if model is None:
+        model = boomi_client.trading_partner_component.get_trading_partner_component(
+            id_=component_id
+        )
+        _TP_MODEL_CACHE.set(key, model)
+    return model
+
+
+def _get_component_cached(boomi_client, component_id: str):
+    """Fetch a component via the Component API, reusing a recent fetch when available."""
+    key = _cache_key(boomi_client, component_id)
+    component = _COMPONENT_CACHE.get(key)
+    if component is None:
+        component = boomi_client.component.get_component(component_id=component_id)
+        _COMPONENT_CACHE.set(key, component)
+    return component
+
+
+def _invalidate_cached_partner(boomi_client, component_id: str) -> None:
+    """Drop every cached view of a trading partner after it changes."""
+    key = _cache_key(boomi_client, component_id)
+    _TP_CACHE.remove(key)
+    _TP_MODEL_CACHE.remove(key)
+    _COMPONENT_CACHE.remove(key)
+    _TP_NOT_FOUND_CACHE.remove(key)
+
+
+def _name(obj):
+    """Component display name: 'name' when set, else the JSON API's 'component_name'."""
+    name = getattr(obj, 'name', None)
+    return name if name is not None else getattr(obj, 'component_name', None)
+
+
+def _first_attr(obj, keys):
+    """Return the first attribute in ``keys`` set on ``obj`` (single __dict__ lookup per key)."""
+    attrs = getattr(obj, '__dict__', None)
+    if attrs is None:
+        return next((getattr(obj, k) for k in keys if hasattr(obj, k)), None)
+    return next((attrs[k] for k in keys if k in attrs), None)
+
+
+def _fix_biginteger_format(obj):
+    """Unwrap API BigInteger pairs (e.g. ['BigInteger', 2575] -> 2575) in place.
+
+    _map() emits plain dicts and lists, so exact type checks are enough here.
+    """
+    obj_type = type(obj)
+    if obj_type is dict:
+        for k, v in obj.items():
+            if type(v) in _MAPPED_CONTAINERS:
+                obj[k] = _fix_biginteger_format(v)
+    elif obj_type is list:
+        if len(obj) == 2 and obj[0] == 'BigInteger':
+            return obj[1]
+        for i, item in enumerate(obj):
+            if type(item) in _MAPPED_CONTAINERS:
+                obj[i] = _fix_biginteger_format(item)
+    return obj
+
+
+def _preserved_communication(trading_partner) -> Optional[Dict[str, Any]]:
+    """Map a partner's existing communication settings to the minimal API dict, or None."""
+    existing_comm = getattr(trading_partner, 'partner_communication', None)
+    if not existing_comm or not hasattr(existing_comm, '_map'):
+        return None
+    preserved = existing_comm._map()
+    if not preserved:
+        return None
+    return _fix_biginteger_format(preserved)
+
+
 
 # ============================================================================
 # Trading Partner CRUD Operations
@@ -87,12 +382,6 @@ def create_trading_partner(boomi_client, profile: str, request_data: Dict[str, A
         }
     """
     try:
-        # Import the JSON model builder
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../'))
-        from boomi_mcp.models.trading_partner_builders import build_trading_partner_model
-
         # Validate required fields
         if not request_data.get("component_name"):
             return {
@@ -126,7 +415,7 @@ def create_trading_partner(boomi_client, profile: str, request_data: Dict[str, A
             return {
                 "_success": False,
                 "error": str(ve),
-                "message": f"Invalid trading partner configuration: {str(ve)}"
+                "message": f"Invalid trading partner configuration: {ve}"
             }
 
         # Create trading partner using TradingPartnerComponent API (JSON-based)
@@ -134,15 +423,8 @@ def create_trading_partner(boomi_client, profile: str, request_data: Dict[str, A
             request_body=tp_model
         )
 
-        # Extract component ID using the same pattern as SDK example
-        # SDK uses 'id_' attribute, not 'component_id'
-        component_id = None
-        if hasattr(result, 'id_'):
-            component_id = result.id_
-        elif hasattr(result, 'component_id'):
-            component_id = result.component_id
-        elif hasattr(result, 'id'):
-            component_id = result.id
+        # Extract component ID (SDK uses 'id_' attribute, older models 'component_id')
+        component_id = _first_attr(result, ('id_', 'component_id', 'id'))
 
         return {
             "_success": True,
@@ -157,14 +439,16 @@ def create_trading_partner(boomi_client, profile: str, request_data: Dict[str, A
         }
 
     except Exception as e:
-        error_msg = str(e)
-        # Provide helpful error messages for common issues
-        if "B2B" in error_msg or "EDI" in error_msg:
+        error_text = str(e)
+        # SDK request errors can carry whole gateway error pages; echo only the head
+        error_msg = error_text[:_MAX_ERROR_TEXT]
+        # Provide helpful error messages for common issues (checked against the full text)
+        if "B2B" in error_text or "EDI" in error_text:
             error_msg = f"{error_msg}. Note: Account must have B2B/EDI feature enabled for trading partner creation."
 
         return {
             "_success": False,
-            "error": str(e),
+            "error": error_text,
             "message": f"Failed to create trading partner: {error_msg}"
         }
 
@@ -185,21 +469,17 @@ def get_trading_partner(boomi_client, profile: str, component_id: str) -> Dict[s
         Trading partner details or error
     """
     try:
+        cache_key = _cache_key(boomi_client, component_id)
+        cached = _TP_CACHE.get(cache_key)
+        if cached is not None:
+            # Callers get their own copy so mutating a result cannot alter the cache
+            return copy.deepcopy(cached)
+
         # Use SDK directly - model deserialization is now fixed
-        result = boomi_client.trading_partner_component.get_trading_partner_component(
-            id_=component_id
-        )
+        result = _get_trading_partner_model(boomi_client, component_id)
 
         # Extract using SDK model attributes
-        retrieved_id = None
-        if hasattr(result, 'id_'):
-            retrieved_id = result.id_
-        elif hasattr(result, 'id'):
-            retrieved_id = result.id
-        elif hasattr(result, 'component_id'):
-            retrieved_id = result.component_id
-        else:
-            retrieved_id = component_id
+        retrieved_id = _first_attr(result, _ID_KEYS) or component_id
 
         # Extract partner details (use snake_case for JSON API attributes)
         partner_info = {}
@@ -224,233 +504,70 @@ def get_trading_partner(boomi_client, profile: str, component_id: str) -> Dict[s
         # Use object attributes for SDK model
         contact = getattr(result, 'contact_info', None)
         if contact:
-            raw_contact = {
-                "name": getattr(contact, 'contact_name', None),
-                "email": getattr(contact, 'email', None),
-                "phone": getattr(contact, 'phone', None),
-                "address1": getattr(contact, 'address1', None),
-                "address2": getattr(contact, 'address2', None),
-                "city": getattr(contact, 'city', None),
-                "state": getattr(contact, 'state', None),
-                "country": getattr(contact, 'country', None),
-                "postalcode": getattr(contact, 'postalcode', None),
-                "fax": getattr(contact, 'fax', None)
-            }
-            contact_info = {k: v for k, v in raw_contact.items() if v}
+            for out_key, attr in _CONTACT_FIELDS:
+                value = getattr(contact, attr, None)
+                if value:
+                    contact_info[out_key] = value
 
         # Parse partner_communication for communication protocols
         comm = getattr(result, 'partner_communication', None)
         if comm:
-            # Disk protocol
-            if getattr(comm, 'disk_communication_options', None):
-                disk_opts = comm.disk_communication_options
-                disk_info = {"protocol": "disk"}
-                get_opts = getattr(disk_opts, 'disk_get_options', None)
-                send_opts = getattr(disk_opts, 'disk_send_options', None)
-                if get_opts:
-                    disk_info["get_directory"] = getattr(get_opts, 'get_directory', None)
-                    disk_info["file_filter"] = getattr(get_opts, 'file_filter', None)
-                if send_opts:
-                    disk_info["send_directory"] = getattr(send_opts, 'send_directory', None)
-                communication_protocols.append(disk_info)
-
-            # FTP protocol
-            if getattr(comm, 'ftp_communication_options', None):
-                ftp_opts = comm.ftp_communication_options
-                ftp_info = {"protocol": "ftp"}
-                settings = getattr(ftp_opts, 'ftp_settings', None)
-                if settings:
-                    ftp_info["host"] = getattr(settings, 'host', None)
-                    ftp_info["port"] = getattr(settings, 'port', None)
-                    ftp_info["user"] = getattr(settings, 'user', None)
-                    ftp_info["connection_mode"] = getattr(settings, 'connection_mode', None)
-                    # Extract FTP SSL options
-                    ftpssl_opts = getattr(settings, 'ftpssl_options', None)
-                    if ftpssl_opts:
-                        ftp_info["ssl_mode"] = getattr(ftpssl_opts, 'sslmode', None)
-                        ftp_info["use_client_authentication"] = getattr(ftpssl_opts, 'use_client_authentication', None)
-                get_opts = getattr(ftp_opts, 'ftp_get_options', None)
-                if get_opts:
-                    ftp_info["remote_directory"] = getattr(get_opts, 'remote_directory', None)
-                # Filter out None values
-                ftp_info = {k: v for k, v in ftp_info.items() if v is not None}
-                communication_protocols.append(ftp_info)
-
-            # SFTP protocol
-            if getattr(comm, 'sftp_communication_options', None):
-                sftp_opts = comm.sftp_communication_options
-                sftp_info = {"protocol": "sftp"}
-                settings = getattr(sftp_opts, 'sftp_settings', None)
-                if settings:
-                    sftp_info["host"] = getattr(settings, 'host', None)
-                    sftp_info["port"] = getattr(settings, 'port', None)
-                    sftp_info["user"] = getattr(settings, 'user', None)
-                    # Extract SFTP SSH options
-                    sftpssh_opts = getattr(settings, 'sftpssh_options', None)
-                    if sftpssh_opts:
-                        sftp_info["ssh_key_auth"] = getattr(sftpssh_opts, 'sshkeyauth', None)
-                        sftp_info["known_host_entry"] = getattr(sftpssh_opts, 'known_host_entry', None)
-                        sftp_info["ssh_key_path"] = getattr(sftpssh_opts, 'sshkeypath', None)
-                    # Extract SFTP proxy settings
-                    proxy_settings = getattr(settings, 'sftp_proxy_settings', None)
-                    if proxy_settings:
-                        sftp_info["proxy_host"] = getattr(proxy_settings, 'host', None)
-                        sftp_info["proxy_port"] = getattr(proxy_settings, 'port', None)
-                        sftp_info["proxy_type"] = getattr(proxy_settings, 'type_', None)
-                get_opts = getattr(sftp_opts, 'sftp_get_options', None)
-                if get_opts:
-                    sftp_info["remote_directory"] = getattr(get_opts, 'remote_directory', None)
-                # Filter out None values
-                sftp_info = {k: v for k, v in sftp_info.items() if v is not None}
-                communication_protocols.append(sftp_info)
-
-            # HTTP protocol
-            if getattr(comm, 'http_communication_options', None):
-                http_opts = comm.http_communication_options
-                http_info = {"protocol": "http"}
-                settings = getattr(http_opts, 'http_settings', None)
-                if settings:
-                    http_info["url"] = getattr(settings, 'url', None)
-                    http_info["authentication_type"] = getattr(settings, 'authentication_type', None)
-                    http_info["connect_timeout"] = getattr(settings, 'connect_timeout', None)
-                    http_info["read_timeout"] = getattr(settings, 'read_timeout', None)
-                    # Extract HTTP auth settings
-                    http_auth = getattr(settings, 'http_auth_settings', None)
-                    if http_auth:
-                        http_info["username"] = getattr(http_auth, 'user', None)
-                    # Extract HTTP SSL options
-                    httpssl_opts = getattr(settings, 'httpssl_options', None)
-                    if httpssl_opts:
-                        http_info["client_auth"] = getattr(httpssl_opts, 'clientauth', None)
-                        http_info["trust_server_cert"] = getattr(httpssl_opts, 'trust_server_cert', None)
-                # Extract HTTP send options
-                send_opts = getattr(http_opts, 'http_send_options', None)
-                if send_opts:
-                    http_info["method_type"] = getattr(send_opts, 'method_type', None)
-                    http_info["data_content_type"] = getattr(send_opts, 'data_content_type', None)
-                    http_info["follow_redirects"] = getattr(send_opts, 'follow_redirects', None)
-                    http_info["return_errors"] = getattr(send_opts, 'return_errors', None)
-                # Filter out None values
-                http_info = {k: v for k, v in http_info.items() if v is not None}
-                communication_protocols.append(http_info)
-
-            # AS2 protocol
-            if getattr(comm, 'as2_communication_options', None):
-                as2_opts = comm.as2_communication_options
-                as2_info = {"protocol": "as2"}
-
-                # Extract AS2SendSettings
-                settings = getattr(as2_opts, 'as2_send_settings', None)
-                if settings:
-                    as2_info["url"] = getattr(settings, 'url', None)
-                    as2_info["authentication_type"] = getattr(settings, 'authentication_type', None)
-                    as2_info["verify_hostname"] = getattr(settings, 'verify_hostname', None)
-                    # Extract basic auth info
-                    auth_settings = getattr(settings, 'auth_settings', None)
-                    if auth_settings:
-                        as2_info["username"] = getattr(auth_settings, 'username', None)
-
-                # Extract AS2SendOptions
-                send_options = getattr(as2_opts, 'as2_send_options', None)
-                if send_options:
-                    # Partner info (as2_id)
-                    partner_info = getattr(send_options, 'as2_partner_info', None)
-                    if partner_info:
-                        as2_info["as2_partner_id"] = getattr(partner_info, 'as2_id', None)
-
-                    # Message options
-                    msg_opts = getattr(send_options, 'as2_message_options', None)
-                    if msg_opts:
-                        as2_info["signed"] = getattr(msg_opts, 'signed', None)
-                        as2_info["encrypted"] = getattr(msg_opts, 'encrypted', None)
-                        as2_info["compressed"] = getattr(msg_opts, 'compressed', None)
-                        as2_info["encryption_algorithm"] = getattr(msg_opts, 'encryption_algorithm', None)
-                        as2_info["signing_digest_alg"] = getattr(msg_opts, 'signing_digest_alg', None)
-
-                    # MDN options
-                    mdn_opts = getattr(send_options, 'as2_mdn_options', None)
-                    if mdn_opts:
-                        as2_info["request_mdn"] = getattr(mdn_opts, 'request_mdn', None)
-                        as2_info["mdn_signed"] = getattr(mdn_opts, 'signed', None)
-                        as2_info["synchronous_mdn"] = getattr(mdn_opts, 'synchronous', None)
-
-                # Filter out None values
-                as2_info = {k: v for k, v in as2_info.items() if v is not None}
-                communication_protocols.append(as2_info)
-
-            # MLLP protocol
-            if getattr(comm, 'mllp_communication_options', None):
-                mllp_opts = comm.mllp_communication_options
-                mllp_info = {"protocol": "mllp"}
-                settings = getattr(mllp_opts, 'mllp_send_settings', None)
-                if settings:
-                    mllp_info["host"] = getattr(settings, 'host', None)
-                    mllp_info["port"] = getattr(settings, 'port', None)
-                    mllp_info["persistent"] = getattr(settings, 'persistent', None)
-                    mllp_info["receive_timeout"] = getattr(settings, 'receive_timeout', None)
-                    mllp_info["send_timeout"] = getattr(settings, 'send_timeout', None)
-                    mllp_info["max_connections"] = getattr(settings, 'max_connections', None)
-                    mllp_info["inactivity_timeout"] = getattr(settings, 'inactivity_timeout', None)
-                    mllp_info["max_retry"] = getattr(settings, 'max_retry', None)
-                    # Extract MLLP SSL options
-                    mllpssl_opts = getattr(settings, 'mllpssl_options', None)
-                    if mllpssl_opts:
-                        mllp_info["use_ssl"] = getattr(mllpssl_opts, 'use_ssl', None)
-                        mllp_info["use_client_ssl"] = getattr(mllpssl_opts, 'use_client_ssl', None)
-                        mllp_info["client_ssl_alias"] = getattr(mllpssl_opts, 'client_ssl_alias', None)
-                        mllp_info["ssl_alias"] = getattr(mllpssl_opts, 'ssl_alias', None)
-                # Filter out None values
-                mllp_info = {k: v for k, v in mllp_info.items() if v is not None}
-                communication_protocols.append(mllp_info)
+            for protocol, options_attr, keep_none, fields in _PROTOCOL_SPECS:
+                protocol_opts = getattr(comm, options_attr, None)
+                if protocol_opts:
+                    communication_protocols.append(
+                        _parse_protocol_options(protocol, protocol_opts, keep_none, fields)
+                    )
 
             # OFTP protocol
-            if getattr(comm, 'oftp_communication_options', None):
-                oftp_opts = comm.oftp_communication_options
+            oftp_opts = getattr(comm, 'oftp_communication_options', None)
+            if oftp_opts:
                 oftp_info = {"protocol": "oftp"}
                 conn_settings = getattr(oftp_opts, 'oftp_connection_settings', None)
                 if conn_settings:
                     # Check both direct attrs and default_oftp_connection_settings
+                    # (getattr on a None default_settings simply yields None)
                     default_settings = getattr(conn_settings, 'default_oftp_connection_settings', None)
-                    # Try direct attributes first, fall back to default settings
-                    oftp_info["host"] = getattr(conn_settings, 'host', None) or (getattr(default_settings, 'host', None) if default_settings else None)
-                    oftp_info["port"] = getattr(conn_settings, 'port', None) or (getattr(default_settings, 'port', None) if default_settings else None)
-                    oftp_info["tls"] = getattr(conn_settings, 'tls', None) if hasattr(conn_settings, 'tls') else (getattr(default_settings, 'tls', None) if default_settings else None)
-                    oftp_info["ssid_auth"] = getattr(conn_settings, 'ssidauth', None) if hasattr(conn_settings, 'ssidauth') else (getattr(default_settings, 'ssidauth', None) if default_settings else None)
-                    oftp_info["sfid_cipher"] = getattr(conn_settings, 'sfidciph', None) if hasattr(conn_settings, 'sfidciph') else (getattr(default_settings, 'sfidciph', None) if default_settings else None)
-                    oftp_info["use_gateway"] = getattr(conn_settings, 'use_gateway', None) if hasattr(conn_settings, 'use_gateway') else (getattr(default_settings, 'use_gateway', None) if default_settings else None)
-                    oftp_info["use_client_ssl"] = getattr(conn_settings, 'use_client_ssl', None) if hasattr(conn_settings, 'use_client_ssl') else (getattr(default_settings, 'use_client_ssl', None) if default_settings else None)
-                    oftp_info["client_ssl_alias"] = getattr(conn_settings, 'client_ssl_alias', None) or (getattr(default_settings, 'client_ssl_alias', None) if default_settings else None)
+                    for out_key, attr, fallback_on_falsy in _OFTP_FIELDS:
+                        value = getattr(conn_settings, attr, _MISSING)
+                        if value is _MISSING or (fallback_on_falsy and not value):
+                            value = getattr(default_settings, attr, None)
+                        oftp_info[out_key] = value
                     # Extract partner info from both locations
-                    partner_info = getattr(conn_settings, 'my_partner_info', None) or (getattr(default_settings, 'my_partner_info', None) if default_settings else None)
-                    if partner_info:
-                        oftp_info["ssid_code"] = getattr(partner_info, 'ssidcode', None)
-                        oftp_info["compress"] = getattr(partner_info, 'ssidcmpr', None)
+                    oftp_partner = (getattr(conn_settings, 'my_partner_info', None)
+                                    or getattr(default_settings, 'my_partner_info', None))
+                    if oftp_partner:
+                        oftp_info["ssid_code"] = getattr(oftp_partner, 'ssidcode', None)
+                        oftp_info["compress"] = getattr(oftp_partner, 'ssidcmpr', None)
                 # Filter out None values
                 oftp_info = {k: v for k, v in oftp_info.items() if v is not None}
                 communication_protocols.append(oftp_info)
 
-        return {
+        response = {
             "_success": True,
             "trading_partner": {
                 "component_id": retrieved_id,
-                "name": getattr(result, 'name', getattr(result, 'component_name', None)),
+                "name": _name(result),
                 "standard": getattr(result, 'standard', None),
                 "classification": getattr(result, 'classification', None),
                 "folder_id": getattr(result, 'folder_id', None),
                 "folder_name": getattr(result, 'folder_name', None),
                 "organization_id": getattr(result, 'organization_id', None),
                 "deleted": getattr(result, 'deleted', False),
-                "partner_info": partner_info if partner_info else None,
-                "contact_info": contact_info if contact_info else None,
-                "communication_protocols": communication_protocols if communication_protocols else []
+                "partner_info": partner_info or None,
+                "contact_info": contact_info or None,
+                "communication_protocols": communication_protocols
             }
         }
+        _TP_CACHE.set(cache_key, copy.deepcopy(response))
+        return response
 
     except Exception as e:
+        error_msg = str(e)
         return {
             "_success": False,
-            "error": str(e),
-            "message": f"Failed to get trading partner: {str(e)}"
+            "error": error_msg,
+            "message": f"Failed to get trading partner: {error_msg}"
         }
 
 
@@ -481,30 +598,29 @@ def list_trading_partners(boomi_client, profile: str, filters: Optional[Dict[str
         if filters:
             # Filter by standard
             if "standard" in filters:
-                expr = TradingPartnerComponentSimpleExpression(
-                    operator=TradingPartnerComponentSimpleExpressionOperator.EQUALS,
-                    property=TradingPartnerComponentSimpleExpressionProperty.STANDARD,
-                    argument=[filters["standard"].lower()]
-                )
-                expressions.append(expr)
+                standard_value = filters["standard"].lower()
+                expressions.append(TradingPartnerComponentSimpleExpression(
+                    operator=_OP_EQUALS,
+                    property=_PROP_STANDARD,
+                    argument=[standard_value]
+                ))
 
             # Filter by classification
             if "classification" in filters:
-                expr = TradingPartnerComponentSimpleExpression(
-                    operator=TradingPartnerComponentSimpleExpressionOperator.EQUALS,
-                    property=TradingPartnerComponentSimpleExpressionProperty.CLASSIFICATION,
-                    argument=[filters["classification"].lower()]
-                )
-                expressions.append(expr)
+                classification_value = filters["classification"].lower()
+                expressions.append(TradingPartnerComponentSimpleExpression(
+                    operator=_OP_EQUALS,
+                    property=_PROP_CLASSIFICATION,
+                    argument=[classification_value]
+                ))
 
             # Filter by name pattern
             if "name_pattern" in filters:
-                expr = TradingPartnerComponentSimpleExpression(
-                    operator=TradingPartnerComponentSimpleExpressionOperator.LIKE,
-                    property=TradingPartnerComponentSimpleExpressionProperty.NAME,
+                expressions.append(TradingPartnerComponentSimpleExpression(
+                    operator=_OP_LIKE,
+                    property=_PROP_NAME,
                     argument=[filters["name_pattern"]]
-                )
-                expressions.append(expr)
+                ))
 
             # Note: NOT_EQUALS operator not available in typed models
             # Deleted filtering would need to be done client-side if needed
@@ -512,15 +628,18 @@ def list_trading_partners(boomi_client, profile: str, filters: Optional[Dict[str
         # If no filters provided, get all trading partners
         if not expressions:
             expression = TradingPartnerComponentSimpleExpression(
-                operator=TradingPartnerComponentSimpleExpressionOperator.LIKE,
-                property=TradingPartnerComponentSimpleExpressionProperty.NAME,
+                operator=_OP_LIKE,
+                property=_PROP_NAME,
                 argument=['%']
             )
         elif len(expressions) == 1:
             expression = expressions[0]
         else:
-            # Multiple expressions - use first one (compound expressions not yet supported)
-            expression = expressions[0]
+            # Multiple filters - AND them server-side so only matching partners come back
+            expression = TradingPartnerComponentGroupingExpression(
+                operator=TradingPartnerComponentGroupingExpressionOperator.AND,
+                nested_expression=expressions
+            )
 
         # Build typed query config
         query_filter = TradingPartnerComponentQueryConfigQueryFilter(expression=expression)
@@ -531,58 +650,56 @@ def list_trading_partners(boomi_client, profile: str, filters: Optional[Dict[str
             request_body=query_config
         )
 
+        # Build partner list and per-standard grouping in one pass, following
+        # queryMore tokens (each page token comes from the previous response)
         partners = []
-        if hasattr(result, 'result') and result.result:
-            for partner in result.result:
+        grouped = defaultdict(list)
+        while True:
+            for partner in getattr(result, 'result', None) or []:
                 # Extract ID using SDK pattern (id_ attribute)
-                partner_id = None
-                if hasattr(partner, 'id_'):
-                    partner_id = partner.id_
-                elif hasattr(partner, 'id'):
-                    partner_id = partner.id
-                elif hasattr(partner, 'component_id'):
-                    partner_id = partner.component_id
-
-                partners.append({
+                partner_id = _first_attr(partner, _ID_KEYS)
+
+                partner_entry = {
                     "component_id": partner_id,
-                    "name": getattr(partner, 'name', getattr(partner, 'component_name', None)),
+                    "name": _name(partner),
                     "standard": getattr(partner, 'standard', None),
                     "classification": getattr(partner, 'classification', None),
                     "folder_name": getattr(partner, 'folder_name', None),
                     "deleted": getattr(partner, 'deleted', False)
-                })
-
-        # Group partners by standard
-        grouped = {}
-        for partner in partners:
-            standard = partner.get("standard", "unknown")
-            if standard:
-                standard_upper = standard.upper()
-                if standard_upper not in grouped:
-                    grouped[standard_upper] = []
-                grouped[standard_upper].append(partner)
+                }
+                partners.append(partner_entry)
+
+                # Group partners by standard
+                standard = partner_entry["standard"]
+                if standard:
+                    grouped[standard.upper()].append(partner_entry)
+
+            query_token = getattr(result, 'query_token', None)
+            if not query_token:
+                break
+            result = boomi_client.trading_partner_component.query_more_trading_partner_component(
+                request_body=query_token
+            )
+
+        summary = {
+            standard: len(grouped.get(standard.upper(), ()))
+            for standard in _SUMMARY_STANDARDS
+        }
 
         return {
             "_success": True,
             "total_count": len(partners),
             "partners": partners,
-            "by_standard": grouped,
-            "summary": {
-                "x12": len(grouped.get("X12", [])),
-                "edifact": len(grouped.get("EDIFACT", [])),
-                "hl7": len(grouped.get("HL7", [])),
-                "custom": len(grouped.get("CUSTOM", [])),
-                "rosettanet": len(grouped.get("ROSETTANET", [])),
-                "tradacoms": len(grouped.get("TRADACOMS", [])),
-                "odette": len(grouped.get("ODETTE", []))
-            }
+            "by_standard": dict(grouped),
+            "summary": summary
         }
 
     except Exception as e:
+        error_msg = str(e)
         return {
             "_success": False,
-            "error": str(e),
-            "message": f"Failed to list trading partners: {str(e)}"
+            "error": error_msg,
+            "message": f"Failed to list trading partners: {error_msg}"
         }
 
 
@@ -627,22 +744,24 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
         will be added in future iterations. Currently supports basic fields.
     """
     try:
-        # Import the JSON model builder
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../'))
-        from boomi_mcp.models.trading_partner_builders import build_contact_info
-        from boomi.models import ContactInfo
-
         # Step 1: Get the existing trading partner using JSON-based API
-        try:
-            existing_tp = boomi_client.trading_partner_component.get_trading_partner_component(
-                id_=component_id
-            )
-        except Exception as e:
+        not_found_key = _cache_key(boomi_client, component_id)
+        not_found_error = _TP_NOT_FOUND_CACHE.get(not_found_key)
+        if not_found_error is None:
+            try:
+                # Always fetch fresh: the whole component is written back, so a cached
+                # model would overwrite edits made elsewhere since it was fetched
+                existing_tp = boomi_client.trading_partner_component.get_trading_partner_component(
+                    id_=component_id
+                )
+            except Exception as e:
+                not_found_error = str(e)
+                if getattr(e, 'status', None) == 404:
+                    _TP_NOT_FOUND_CACHE.set(not_found_key, not_found_error)
+        if not_found_error is not None:
             return {
                 "_success": False,
-                "error": f"Component not found: {str(e)}",
+                "error": f"Component not found: {not_found_error}",
                 "message": f"Trading partner {component_id} not found or could not be retrieved"
             }
 
@@ -652,7 +771,6 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
 
         # Check if protocol updates were specified (these will REPLACE existing communications)
         # Support both nested format (*_settings) and flat format (*_host, *_url, etc.)
-        from boomi_mcp.models.trading_partner_builders import PartnerCommunicationDict
         flat_protocol_prefixes = ["ftp_", "sftp_", "http_", "as2_", "disk_", "mllp_", "oftp_"]
         has_flat_protocol_updates = any(
             any(key.startswith(prefix) for prefix in flat_protocol_prefixes)
@@ -671,13 +789,11 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
             existing_tp.description = updates["description"]
 
         if "classification" in updates:
-            from boomi.models import TradingPartnerComponentClassification
             classification = updates["classification"]
             if isinstance(classification, str):
-                if classification.lower() == "mycompany":
-                    existing_tp.classification = TradingPartnerComponentClassification.MYCOMPANY
-                else:
-                    existing_tp.classification = TradingPartnerComponentClassification.TRADINGPARTNER
+                existing_tp.classification = _CLASSIFICATION_MAP.get(
+                    classification.lower(), TradingPartnerComponentClassification.TRADINGPARTNER
+                )
             else:
                 existing_tp.classification = classification
 
@@ -692,9 +808,7 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
             contact_updates = updates["contact_info"]
         else:
             # Flat format - extract contact_* parameters
-            for key in updates:
-                if key.startswith('contact_'):
-                    contact_updates[key] = updates[key]
+            contact_updates = {key: updates[key] for key in _CONTACT_KEYS & updates.keys()}
 
         if contact_updates:
             # Build ContactInfo model from updates
@@ -704,36 +818,13 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
 
         # Protocol-specific updates - PRESERVE existing protocols and merge with updates
         if has_protocol_updates:
-            from boomi_mcp.models.trading_partner_builders import (
-                build_as2_communication_options,
-                build_http_communication_options,
-                build_sftp_communication_options,
-                build_ftp_communication_options,
-                build_disk_communication_options,
-                build_mllp_communication_options,
-                build_oftp_communication_options
-            )
-
             comm_dict = {}
 
             # First, preserve ALL existing protocols using PartnerCommunication._map()
             # This produces the minimal structure that the API accepts
-            existing_comm = getattr(existing_tp, 'partner_communication', None)
-            if existing_comm and hasattr(existing_comm, '_map'):
-                # Use the SDK's _map() which properly filters to minimal structure
-                preserved = existing_comm._map()
-                if preserved:
-                    # Fix BigInteger format returned by API (e.g., ['BigInteger', 2575] -> 2575)
-                    def fix_biginteger_format(obj):
-                        if isinstance(obj, dict):
-                            return {k: fix_biginteger_format(v) for k, v in obj.items()}
-                        elif isinstance(obj, list):
-                            if len(obj) == 2 and obj[0] == 'BigInteger':
-                                return obj[1]
-                            return [fix_biginteger_format(item) for item in obj]
-                        return obj
-                    preserved = fix_biginteger_format(preserved)
-                    comm_dict.update(preserved)
+            preserved = _preserved_communication(existing_tp)
+            if preserved:
+                comm_dict.update(preserved)
 
             # Handle flat parameters (preferred format from server.py)
             # These will UPDATE or ADD protocols on top of preserved ones
@@ -1074,43 +1165,33 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
         # Fix BigInteger format in existing partner_communication (e.g., MLLP port)
         # This is needed even when there are no protocol updates
         if not has_protocol_updates:
-            existing_comm = getattr(existing_tp, 'partner_communication', None)
-            if existing_comm and hasattr(existing_comm, '_map'):
-                preserved = existing_comm._map()
-                if preserved:
-                    def fix_biginteger_format(obj):
-                        if isinstance(obj, dict):
-                            return {k: fix_biginteger_format(v) for k, v in obj.items()}
-                        elif isinstance(obj, list):
-                            if len(obj) == 2 and obj[0] == 'BigInteger':
-                                return obj[1]
-                            return [fix_biginteger_format(item) for item in obj]
-                        return obj
-                    preserved = fix_biginteger_format(preserved)
-                    from boomi_mcp.models.trading_partner_builders import PartnerCommunicationDict
-                    existing_tp.partner_communication = PartnerCommunicationDict(preserved)
+            preserved = _preserved_communication(existing_tp)
+            if preserved:
+                existing_tp.partner_communication = PartnerCommunicationDict(preserved)
 
         # Step 3: Update the trading partner using JSON-based API
         result = boomi_client.trading_partner_component.update_trading_partner_component(
             id_=component_id,
             request_body=existing_tp
         )
+        _invalidate_cached_partner(boomi_client, component_id)
 
         return {
             "_success": True,
             "trading_partner": {
                 "component_id": component_id,
                 "name": updates.get("component_name", getattr(existing_tp, 'component_name', None)),
-                "updated_fields": list(updates.keys())
+                "updated_fields": tuple(updates)
             },
             "message": f"Successfully updated trading partner: {component_id}"
         }
 
     except Exception as e:
+        error_msg = str(e)
         return {
             "_success": False,
-            "error": str(e),
-            "message": f"Failed to update trading partner: {str(e)}"
+            "error": error_msg,
+            "message": f"Failed to update trading partner: {error_msg}"
         }
 
 
@@ -1128,6 +1209,7 @@ def delete_trading_partner(boomi_client, profile: str, component_id: str) -> Dic
     """
     try:
         result = boomi_client.trading_partner_component.delete_trading_partner_component(component_id)
+        _invalidate_cached_partner(boomi_client, component_id)
 
         return {
             "_success": True,
@@ -1137,10 +1219,11 @@ def delete_trading_partner(boomi_client, profile: str, component_id: str) -> Dic
         }
 
     except Exception as e:
+        error_msg = str(e)
         return {
             "_success": False,
-            "error": str(e),
-            "message": f"Failed to delete trading partner: {str(e)}"
+            "error": error_msg,
+            "message": f"Failed to delete trading partner: {error_msg}"
         }
 
 
@@ -1148,65 +1231,114 @@ def bulk_create_trading_partners(boomi_client, profile: str, partners: List[Dict
     """
     Create multiple trading partners in a single operation.
 
+    The SDK has no bulk create endpoint, so each partner is created with its own
+    create_trading_partner_component call. Calls run on a small thread pool, at most
+    100 partners per batch. Partners that fail are reported in failed while the
+    others are still created.
+
     Args:
         boomi_client: Authenticated Boomi SDK client
         profile: Profile name for authentication
-        partners: List of trading partner configurations
+        partners: List of trading partner configurations, each in the
+            create_trading_partner request_data format
 
     Returns:
         Bulk creation results or error
     """
     try:
-        # Prepare bulk request
-        bulk_data = {
-            "TradingPartnerComponent": []
-        }
-
-        for partner_data in partners:
-            partner_component = {
-                "componentName": partner_data.get("component_name"),
-                "standard": partner_data.get("standard", "x12").lower(),
-                "classification": partner_data.get("classification", "tradingpartner").lower()
-            }
-
-            # Add optional fields
-            if "folder_name" in partner_data:
-                partner_component["folderName"] = partner_data["folder_name"]
-            if "contact_info" in partner_data:
-                partner_component["ContactInfo"] = partner_data["contact_info"]
-            if "partner_info" in partner_data:
-                partner_component["PartnerInfo"] = partner_data["partner_info"]
-
-            bulk_data["TradingPartnerComponent"].append(partner_component)
-
-        # Execute bulk create
-        result = boomi_client.trading_partner_component.bulk_create_trading_partner_component(bulk_data)
-
         created_partners = []
-        if hasattr(result, 'TradingPartnerComponent'):
-            for partner in result.TradingPartnerComponent:
-                created_partners.append({
-                    "component_id": getattr(partner, 'component_id', None),
-                    "name": getattr(partner, 'component_name', None),
-                    "standard": getattr(partner, 'standard', None)
-                })
+        failed = []
+        with ThreadPoolExecutor(max_workers=_BULK_CREATE_WORKERS) as executor:
+            for start in range(0, len(partners), BULK_CHUNK):
+                batch = partners[start:start + BULK_CHUNK]
+                results = executor.map(
+                    lambda partner_data: create_trading_partner(boomi_client, profile, partner_data),
+                    batch
+                )
+                for index, result in enumerate(results, start):
+                    if result.get("_success"):
+                        created_partners.append(result["trading_partner"])
+                    else:
+                        failed.append({
+                            "index": index,
+                            "component_name": partners[index].get("component_name"),
+                            "error": result.get("error")
+                        })
+
+        if failed and not created_partners:
+            error_msg = failed[0]["error"]
+            return {
+                "_success": False,
+                "error": error_msg,
+                "failed": failed,
+                "message": f"Failed to bulk create trading partners: {error_msg}"
+            }
 
-        return {
+        result = {
             "_success": True,
             "created_count": len(created_partners),
             "partners": created_partners,
             "message": f"Successfully created {len(created_partners)} trading partners"
         }
+        if failed:
+            result["failed"] = failed
+            result["message"] += f" ({len(failed)} of {len(partners)} failed)"
+        return result
 
     except Exception as e:
+        error_msg = str(e)
         return {
             "_success": False,
-            "error": str(e),
-            "message": f"Failed to bulk create trading partners: {str(e)}"
+            "error": error_msg,
+            "message": f"Failed to bulk create trading partners: {error_msg}"
+        }
+
+
+def _parent_reference_entry(parent_id: str, parent_version, parent_comp) -> Dict[str, Any]:
+    """Build a referenced_by entry from a fetched parent component."""
+    return {
+        "component_id": parent_id,
+        "name": getattr(parent_comp, 'name', 'Unknown'),
+        "type": getattr(parent_comp, 'type', 'unknown'),
+        "version": str(parent_version)
+    }
+
+
+def _parent_ref(ref):
+    """Return (parent_id, parent_version) for a reference, or None without a parent id."""
+    try:
+        parent_id, parent_version = _get_parent_ref(ref)
+    except AttributeError:
+        # Unset fields are simply absent on SDK models
+        parent_id = getattr(ref, 'parent_component_id', None)
+        parent_version = getattr(ref, 'parent_version', None)
+    return (parent_id, parent_version) if parent_id else None
+
+
+def _fetch_parent_component(boomi_client, parent_id: str):
+    """Fetch one parent component, returning the exception instead of raising it."""
+    try:
+        return _get_component_cached(boomi_client, parent_id)
+    except Exception as e:
+        return e
+
+
+def _describe_parent_reference(parent_id: str, parent_version, parent_comp) -> Dict[str, Any]:
+    """Build a referenced_by entry for one parent component, tolerating lookup failures."""
+    if isinstance(parent_comp, Exception):
+        # If we can't get parent component details, still include the reference
+        return {
+            "component_id": parent_id,
+            "name": "Unknown",
+            "type": "unknown",
+            "version": str(parent_version),
+            "error": str(parent_comp)
         }
+    return _parent_reference_entry(parent_id, parent_version, parent_comp)
 
 
-def analyze_trading_partner_usage(boomi_client, profile: str, component_id: str) -> Dict[str, Any]:
+def analyze_trading_partner_usage(boomi_client, profile: str, component_id: str,
+                                  limit: Optional[int] = None) -> Dict[str, Any]:
     """
     Analyze where a trading partner is used in processes and configurations.
 
@@ -1217,24 +1349,21 @@ def analyze_trading_partner_usage(boomi_client, profile: str, component_id: str)
         boomi_client: Authenticated Boomi SDK client
         profile: Profile name for authentication
         component_id: Trading partner component ID
+        limit: Maximum number of references to resolve and return (all when None).
+            Totals and can_safely_delete always cover every reference.
 
     Returns:
         Usage analysis including processes, connections, and dependencies
     """
-    try:
-        # Get the trading partner details first using Component API (avoids ContactInfo parsing issues)
-        partner = boomi_client.component.get_component(component_id=component_id)
-        partner_name = getattr(partner, 'name', 'Unknown')
+    if limit is not None and limit < 1:
+        return {
+            "_success": False,
+            "error": f"Invalid limit: {limit}",
+            "message": "limit must be a positive integer"
+        }
 
+    try:
         # Query for component references using the QUERY endpoint (returns 200 with empty results, not 400)
-        from boomi.models import (
-            ComponentReferenceQueryConfig,
-            ComponentReferenceQueryConfigQueryFilter,
-            ComponentReferenceSimpleExpression,
-            ComponentReferenceSimpleExpressionOperator,
-            ComponentReferenceSimpleExpressionProperty
-        )
-
         # Build query to find all components that reference this trading partner
         expression = ComponentReferenceSimpleExpression(
             operator=ComponentReferenceSimpleExpressionOperator.EQUALS,
@@ -1247,43 +1376,50 @@ def analyze_trading_partner_usage(boomi_client, profile: str, component_id: str)
         # Execute query
         query_result = boomi_client.component_reference.query_component_reference(request_body=query_config)
 
-        # Collect all referenced components
-        referenced_by = []
-
-        # Extract references from query results
-        if hasattr(query_result, 'result') and query_result.result:
-            for result_item in query_result.result:
-                # Each result item has a 'references' array
-                refs = getattr(result_item, 'references', [])
-                if not refs:
-                    continue
-
-                for ref in refs:
-                    parent_id = getattr(ref, 'parent_component_id', None)
-                    parent_version = getattr(ref, 'parent_version', None)
-
-                    if parent_id:
-                        # Try to get component metadata
-                        try:
-                            parent_comp = boomi_client.component.get_component(component_id=parent_id)
-                            comp_type = getattr(parent_comp, 'type', 'unknown')
-                            comp_name = getattr(parent_comp, 'name', 'Unknown')
-
-                            referenced_by.append({
-                                "component_id": parent_id,
-                                "name": comp_name,
-                                "type": comp_type,
-                                "version": str(parent_version)
-                            })
-                        except Exception as e:
-                            # If we can't get parent component details, still include the reference
-                            referenced_by.append({
-                                "component_id": parent_id,
-                                "name": "Unknown",
-                                "type": "unknown",
-                                "version": str(parent_version),
-                                "error": str(e)
-                            })
+        # Collect (parent_id, parent_version) for every reference. All of them are
+        # counted; only the first `limit` are resolved, so parents beyond it are never fetched.
+        result_items = getattr(query_result, 'result', None) or ()
+        # Each result item has a 'references' array
+        refs = chain.from_iterable(
+            getattr(result_item, 'references', None) or () for result_item in result_items
+        )
+        all_parent_refs = list(filter(None, map(_parent_ref, refs)))
+        total_references = len(all_parent_refs)
+        parent_refs = all_parent_refs[:limit]
+
+        # Nothing references the partner: skip the partner fetch entirely
+        if not parent_refs:
+            return {
+                "_success": True,
+                "trading_partner": {"component_id": component_id},
+                "referenced_by": [],
+                "total_references": 0,
+                "truncated": False,
+                "can_safely_delete": True,
+                "_note": _USAGE_NOTE
+            }
+
+        # Get the trading partner details using Component API (avoids ContactInfo parsing issues).
+        # The fetch runs alongside the parent lookups below instead of ahead of them.
+        with ThreadPoolExecutor(max_workers=1) as partner_executor:
+            partner_future = partner_executor.submit(_get_component_cached, boomi_client, component_id)
+
+            # Resolve parent metadata concurrently. Each unique parent is fetched once,
+            # however many of its versions reference the partner.
+            parent_ids = list(dict.fromkeys(pid for pid, _ in parent_refs))
+            with ThreadPoolExecutor(max_workers=min(_MAX_REFERENCE_WORKERS, len(parent_ids))) as executor:
+                components = dict(zip(parent_ids, executor.map(
+                    lambda pid: _fetch_parent_component(boomi_client, pid), parent_ids
+                )))
+
+            partner = partner_future.result()
+        partner_name = getattr(partner, 'name', 'Unknown')
+
+        # One entry per reference, in reference order
+        referenced_by = [
+            _describe_parent_reference(parent_id, parent_version, components[parent_id])
+            for parent_id, parent_version in parent_refs
+        ]
 
         analysis = {
             "_success": True,
@@ -1293,18 +1429,20 @@ def analyze_trading_partner_usage(boomi_client, profile: str, component_id: str)
                 "standard": getattr(partner, 'standard', None)
             },
             "referenced_by": referenced_by,
-            "total_references": len(referenced_by),
-            "can_safely_delete": len(referenced_by) == 0,
-            "_note": "Shows immediate references (one level). UI's 'Show Where Used' does recursive tracing."
+            "total_references": total_references,
+            "truncated": total_references > len(referenced_by),
+            "can_safely_delete": total_references == 0,
+            "_note": _USAGE_NOTE
         }
 
         return analysis
 
     except Exception as e:
+        error_msg = str(e)
         return {
             "_success": False,
-            "error": str(e),
-            "message": f"Failed to analyze trading partner usage: {str(e)}"
+            "error": error_msg,
+            "message": f"Failed to analyze trading partner usage: {error_msg}"
         }
 
 
@@ -1312,6 +1450,38 @@ def analyze_trading_partner_usage(boomi_client, profile: str, component_id: str)
 # Consolidated Action Router (for MCP tool consolidation)
 # ============================================================================
 
+# action -> (handler, ((param name, error if missing or None when optional, hint), ...))
+# Params are passed positionally after (boomi_client, profile) in the listed order.
+_ACTIONS = {
+    "list": (list_trading_partners, (
+        ("filters", None, None),
+    )),
+    "get": (get_trading_partner, (
+        ("partner_id", "partner_id is required for 'get' action",
+         "Provide the trading partner component ID to retrieve"),
+    )),
+    "create": (create_trading_partner, (
+        ("request_data", "request_data is required for 'create' action",
+         "Provide trading partner configuration including standard, name, and standard-specific parameters. Use get_schema_template for expected format."),
+    )),
+    "update": (update_trading_partner, (
+        ("partner_id", "partner_id is required for 'update' action",
+         "Provide the trading partner component ID to update"),
+        ("updates", "updates dict is required for 'update' action",
+         "Provide the fields to update in the trading partner configuration"),
+    )),
+    "delete": (delete_trading_partner, (
+        ("partner_id", "partner_id is required for 'delete' action",
+         "Provide the trading partner component ID to delete"),
+    )),
+    "analyze_usage": (analyze_trading_partner_usage, (
+        ("partner_id", "partner_id is required for 'analyze_usage' action",
+         "Provide the trading partner component ID to analyze"),
+        ("limit", None, None),
+    )),
+}
+
+
 def manage_trading_partner_action(
     boomi_client,
     profile: str,
@@ -1347,83 +1517,53 @@ def manage_trading_partner_action(
           Params: partner_id (required str)
 
         - analyze_usage: Analyze where trading partner is used
-          Params: partner_id (required str)
+          Params: partner_id (required str), limit (optional int)
 
     Returns:
         Action result dict with success status and data/error
     """
     try:
-        if action == "list":
-            filters = params.get("filters", None)
-            return list_trading_partners(boomi_client, profile, filters)
-
-        elif action == "get":
-            partner_id = params.get("partner_id")
-            if not partner_id:
-                return {
-                    "_success": False,
-                    "error": "partner_id is required for 'get' action",
-                    "hint": "Provide the trading partner component ID to retrieve"
-                }
-            return get_trading_partner(boomi_client, profile, partner_id)
-
-        elif action == "create":
-            request_data = params.get("request_data")
-            if not request_data:
-                return {
-                    "_success": False,
-                    "error": "request_data is required for 'create' action",
-                    "hint": "Provide trading partner configuration including standard, name, and standard-specific parameters. Use get_schema_template for expected format."
-                }
-            return create_trading_partner(boomi_client, profile, request_data)
-
-        elif action == "update":
-            partner_id = params.get("partner_id")
-            updates = params.get("updates")
-            if not partner_id:
-                return {
-                    "_success": False,
-                    "error": "partner_id is required for 'update' action",
-                    "hint": "Provide the trading partner component ID to update"
-                }
-            if not updates:
-                return {
-                    "_success": False,
-                    "error": "updates dict is required for 'update' action",
-                    "hint": "Provide the fields to update in the trading partner configuration"
-                }
-            return update_trading_partner(boomi_client, profile, partner_id, updates)
-
-        elif action == "delete":
-            partner_id = params.get("partner_id")
-            if not partner_id:
-                return {
-                    "_success": False,
-                    "error": "partner_id is required for 'delete' action",
-                    "hint": "Provide the trading partner component ID to delete"
-                }
-            return delete_trading_partner(boomi_client, profile, partner_id)
-
-        elif action == "analyze_usage":
-            partner_id = params.get("partner_id")
-            if not partner_id:
-                return {
-                    "_success": False,
-                    "error": "partner_id is required for 'analyze_usage' action",
-                    "hint": "Provide the trading partner component ID to analyze"
-                }
-            return analyze_trading_partner_usage(boomi_client, profile, partner_id)
-
-        else:
+        entry = _ACTIONS.get(action)
+        if entry is None:
             return {
                 "_success": False,
                 "error": f"Unknown action: {action}",
-                "hint": "Valid actions are: list, get, create, update, delete, analyze_usage"
+                "hint": f"Valid actions are: {', '.join(_ACTIONS)}"
             }
 
+        handler, arg_specs = entry
+        args = []
+        for param_name, required_error, hint in arg_specs:
+            value = params.get(param_name)
+            if required_error and not value:
+                return {
+                    "_success": False,
+                    "error": required_error,
+                    "hint": hint
+                }
+            args.append(value)
+        return handler(boomi_client, profile, *args)
+
     except Exception as e:
         return {
             "_success": False,
-            "error": f"Action '{action}' failed: {str(e)}",
+            "error": f"Action '{action}' failed: {e}",
             "exception_type": type(e).__name__
-        }
\ No newline at end of file
+        }
+
+
+async def manage_trading_partner_action_async(
+    boomi_client,
+    profile: str,
+    action: str,
+    **params
+) -> Dict[str, Any]:
+    """
+    Async variant of manage_trading_partner_action for event-loop callers.
+
+    The Boomi SDK has no async surface, so the action runs in a worker thread
+    and the event loop stays free to serve other tool calls meanwhile.
+    """
+    return await asyncio.to_thread(
+        manage_trading_partner_action, boomi_client, profile, action, **params
+    )
@@ -15,8 +15,14 @@ Supported Standards:
 - Custom formats
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from functools import lru_cache, wraps
+from string import Formatter
 import json
+import sys
+from types import MappingProxyType
+from collections import defaultdict
+import xml.etree.ElementTree as ET
 from datetime import datetime
 
 # Import typed models for query operations
@@ -33,6 +39,179 @@ from boomi.models import (
 # XML Template Builders (aligned with boomi-python SDK examples)
 # ============================================================================
 
+# Rendered XML kept per builder for repeated identical calls (bulk imports
+# often differ only in a few values); see _render_cache
+_RENDER_CACHE_SIZE = 512
+
+# (ContactInfo attribute, builder parameter) pairs, in attribute order
+_CONTACT_FIELDS = (
+    ("name", "contact_name"),
+    ("email", "contact_email"),
+    ("phone", "contact_phone"),
+    ("fax", "contact_fax"),
+    ("address1", "contact_address"),
+    ("address2", "contact_address2"),
+    ("city", "contact_city"),
+    ("state", "contact_state"),
+    ("country", "contact_country"),
+    ("postalcode", "contact_postalcode"),
+)
+
+# ContactInfo element when no contact field is set
+_EMPTY_CONTACT_INFO = "<ContactInfo />"
+
+
+def _build_contact_info_xml(contact: Dict[str, Any]) -> str:
+    """
+    Build the ContactInfo element shared by every trading partner standard.
+
+    Args:
+        contact: Mapping holding any of the contact_* builder parameters
+
+    Returns:
+        ContactInfo XML with an attribute for each non-empty field
+    """
+    # Most generated partners carry no contact details at all
+    if not any(contact.get(param) for _, param in _CONTACT_FIELDS):
+        return _EMPTY_CONTACT_INFO
+
+    attrs = " ".join(
+        f'{attr}="{_esc(contact[param])}"' for attr, param in _CONTACT_FIELDS if contact.get(param)
+    )
+    return f'<ContactInfo {attrs} />'
+
+
+# Component envelope shared by every standard, split around the standard-specific
+# PartnerInfo content. Fill-time placeholders are doubled in the header so
+# _partner_template's format() only fills in {standard}.
+_COMPONENT_HEADER = sys.intern('''<?xml version="1.0" encoding="UTF-8"?>
+<bns:Component xmlns:bns="http://api.platform.boomi.com/"
+               name="{{name}}"
+               type="tradingpartner"
+               folderName="{{folder_name}}">
+    <bns:encryptedValues />
+    <bns:description>{{description}}</bns:description>
+    <bns:object>
+        <TradingPartner classification="{{classification}}" standard="{standard}">
+            {{contact_info_xml}}
+            <PartnerInfo>
+''')
+
+# Closes PartnerInfo and holds the standard's (empty) communication options
+_PARTNER_COMMUNICATION = '''            </PartnerInfo>
+            <PartnerCommunication>
+                <{communication_tag}>
+                    <CommunicationOptions />
+                </{communication_tag}>
+            </PartnerCommunication>
+'''
+
+_COMPONENT_FOOTER = sys.intern('''            <DocumentTypes />
+            <Archiving />
+        </TradingPartner>
+    </bns:object>
+    <bns:processOverrides />
+</bns:Component>''')
+
+
+def _partner_template(standard: str, communication_tag: str,
+                      partner_info: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Compile the component template for one standard.
+
+    Only the PartnerInfo content and the PartnerCommunication element name vary
+    between standards; the envelope and communication block are shared.
+
+    The template is split once into (literal text, placeholder name) pairs so
+    rendering is a single join rather than re-parsing the format string per call.
+    """
+    template = (
+        _COMPONENT_HEADER.format(standard=standard)
+        + partner_info
+        + _PARTNER_COMMUNICATION.format(communication_tag=communication_tag)
+        + _COMPONENT_FOOTER
+    )
+    return tuple((literal, field) for literal, field, _, _ in Formatter().parse(template))
+
+
+# Characters that must be escaped in XML attribute values and element text
+_XML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def _esc(value: Any) -> str:
+    """Convert a value to text (None as empty) and escape it for XML attribute or element text."""
+    if value is None:
+        return ""
+    return str(value).translate(_XML_ESCAPE_TABLE)
+
+
+def _render_partner_xml(template: Tuple[Tuple[str, Optional[str]], ...], params: Dict[str, Any]) -> str:
+    """
+    Fill a trading partner template from a builder's parameters.
+
+    Every parameter is converted to text (None as empty) and XML-escaped once,
+    and the template's {contact_info_xml} slot is built from the contact_* parameters.
+    """
+    values = {key: _esc(value) for key, value in params.items()}
+    values["contact_info_xml"] = _build_contact_info_xml(params)
+
+    parts = []
+    for literal, field in template:
+        parts.append(literal)
+        if field:
+            parts.append(values[field])
+    return "".join(parts)
+
+
+def _render_cache(builder):
+    """
+    Memoize a builder's rendered XML with lru_cache.
+
+    Arguments are cached by type as well as value, since the builders render
+    True, 1 and 1.0 differently. Calls with unhashable arguments (a list or dict
+    from JSON input) cannot be cached and are rendered directly.
+    """
+    cached = lru_cache(maxsize=_RENDER_CACHE_SIZE, typed=True)(builder)
+
+    @wraps(builder)
+    def wrapper(*args, **kwargs):
+        try:
+            hash((args, tuple(kwargs.items())))
+        except TypeError:
+            return builder(*args, **kwargs)
+        return cached(*args, **kwargs)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+# X12 trading partner component XML, filled in by build_trading_partner_xml_x12
+_X12_TEMPLATE = _partner_template("x12", "X12PartnerCommunication", '''                <X12PartnerInfo>
+                    <X12Options
+                        acknowledgementoption="{acknowledgementoption}"
+                        envelopeoption="{envelopeoption}"
+                        fileDelimiter="{file_delimiter}"
+                        filteracknowledgements="{filter_acknowledgements}"
+                        outboundInterchangeValidation="{outbound_interchange_validation}"
+                        outboundValidationOption="{outbound_validation_option}"
+                        rejectDuplicateInterchange="{reject_duplicate_interchange}"
+                        segmentchar="{segment_char}" />
+                    <X12ControlInfo>
+                        <ISAControlInfo
+                            ackrequested="{isa_ackrequested}"
+                            authorinfoqual="{isa_authorinfoqual}"
+                            interchangeid="{isa_interchangeid}"
+                            interchangeidqual="{isa_interchangeidqual}"
+                            securityinfoqual="{isa_securityinfoqual}"
+                            testindicator="{isa_testindicator}" />
+                        <GSControlInfo respagencycode="{gs_respagencycode}" />
+                    </X12ControlInfo>
+                </X12PartnerInfo>
+''')
+
+
+@_render_cache
 def build_trading_partner_xml_x12(
     name: str,
     folder_name: str = "Home",
@@ -60,7 +239,9 @@ def build_trading_partner_xml_x12(
     contact_name: str = "",
     contact_email: str = "",
     contact_phone: str = "",
+    contact_fax: str = "",
     contact_address: str = "",
+    contact_address2: str = "",
     contact_city: str = "",
     contact_state: str = "",
     contact_country: str = "",
@@ -114,159 +295,11 @@ def build_trading_partner_xml_x12(
     Returns:
         XML string for creating the trading partner component
     """
-    # Build ContactInfo XML with provided attributes
-    contact_attrs = []
-    if contact_name:
-        contact_attrs.append(f'name="{contact_name}"')
-    if contact_email:
-        contact_attrs.append(f'email="{contact_email}"')
-    if contact_phone:
-        contact_attrs.append(f'phone="{contact_phone}"')
-    if contact_fax:
-        contact_attrs.append(f'fax="{contact_fax}"')
-    if contact_address:
-        contact_attrs.append(f'address1="{contact_address}"')
-    if contact_address2:
-        contact_attrs.append(f'address2="{contact_address2}"')
-    if contact_city:
-        contact_attrs.append(f'city="{contact_city}"')
-    if contact_state:
-        contact_attrs.append(f'state="{contact_state}"')
-    if contact_country:
-        contact_attrs.append(f'country="{contact_country}"')
-    if contact_postalcode:
-        contact_attrs.append(f'postalcode="{contact_postalcode}"')
-
-    if contact_attrs:
-        contact_info_xml = f'<ContactInfo {" ".join(contact_attrs)} />'
-    else:
-        contact_info_xml = "<ContactInfo />"
-
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<bns:Component xmlns:bns="http://api.platform.boomi.com/"
-               name="{name}"
-               type="tradingpartner"
-               folderName="{folder_name}">
-    <bns:encryptedValues />
-    <bns:description>{description}</bns:description>
-    <bns:object>
-        <TradingPartner classification="{classification}" standard="x12">
-            {contact_info_xml}
-            <PartnerInfo>
-                <X12PartnerInfo>
-                    <X12Options
-                        acknowledgementoption="{acknowledgementoption}"
-                        envelopeoption="{envelopeoption}"
-                        fileDelimiter="{file_delimiter}"
-                        filteracknowledgements="{filter_acknowledgements}"
-                        outboundInterchangeValidation="{outbound_interchange_validation}"
-                        outboundValidationOption="{outbound_validation_option}"
-                        rejectDuplicateInterchange="{reject_duplicate_interchange}"
-                        segmentchar="{segment_char}" />
-                    <X12ControlInfo>
-                        <ISAControlInfo
-                            ackrequested="{isa_ackrequested}"
-                            authorinfoqual="{isa_authorinfoqual}"
-                            interchangeid="{isa_interchangeid}"
-                            interchangeidqual="{isa_interchangeidqual}"
-                            securityinfoqual="{isa_securityinfoqual}"
-                            testindicator="{isa_testindicator}" />
-                        <GSControlInfo respagencycode="{gs_respagencycode}" />
-                    </X12ControlInfo>
-                </X12PartnerInfo>
-            </PartnerInfo>
-            <PartnerCommunication>
-                <X12PartnerCommunication>
-                    <CommunicationOptions />
-                </X12PartnerCommunication>
-            </PartnerCommunication>
-            <DocumentTypes />
-            <Archiving />
-        </TradingPartner>
-    </bns:object>
-    <bns:processOverrides />
-</bns:Component>'''
-
-
-def build_trading_partner_xml_edifact(
-    name: str,
-    folder_name: str = "Home",
-    description: str = "",
-    classification: str = "mytradingpartner",
-    # UNB parameters
-    unb_interchangeid: str = "",
-    unb_interchangeidqual: str = "14",
-    unb_partnerid: str = "",
-    unb_partneridqual: str = "14",
-    unb_testindicator: str = "1",
-    # ContactInfo parameters
-    contact_name: str = "",
-    contact_email: str = "",
-    contact_phone: str = "",
-    contact_address: str = "",
-    contact_city: str = "",
-    contact_state: str = "",
-    contact_country: str = "",
-    contact_postalcode: str = ""
-) -> str:
-    """
-    Build EDIFACT trading partner component XML.
-
-    Args:
-        name: Trading partner component name
-        folder_name: Folder to create the component in
-        description: Component description
-        classification: Partner classification
-        unb_interchangeid: UNB interchange ID
-        unb_interchangeidqual: UNB interchange ID qualifier
-        unb_partnerid: UNB partner ID
-        unb_partneridqual: UNB partner ID qualifier
-        unb_testindicator: Test indicator (1=Production, others for test)
-        contact_*: Optional contact information fields
+    return _render_partner_xml(_X12_TEMPLATE, locals())
 
-    Returns:
-        XML string for creating EDIFACT trading partner
-    """
-    # Build ContactInfo XML with provided attributes
-    contact_attrs = []
-    if contact_name:
-        contact_attrs.append(f'name="{contact_name}"')
-    if contact_email:
-        contact_attrs.append(f'email="{contact_email}"')
-    if contact_phone:
-        contact_attrs.append(f'phone="{contact_phone}"')
-    if contact_fax:
-        contact_attrs.append(f'fax="{contact_fax}"')
-    if contact_address:
-        contact_attrs.append(f'address1="{contact_address}"')
-    if contact_address2:
-        contact_attrs.append(f'address2="{contact_address2}"')
-    if contact_city:
-        contact_attrs.append(f'city="{contact_city}"')
-    if contact_state:
-        contact_attrs.append(f'state="{contact_state}"')
-    if contact_country:
-        contact_attrs.append(f'country="{contact_country}"')
-    if contact_postalcode:
-        contact_attrs.append(f'postalcode="{contact_postalcode}"')
-
-    if contact_attrs:
-        contact_info_xml = f'<ContactInfo {" ".join(contact_attrs)} />'
-    else:
-        contact_info_xml = "<ContactInfo />"
 
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<bns:Component xmlns:bns="http://api.platform.boomi.com/"
-               name="{name}"
-               type="tradingpartner"
-               folderName="{folder_name}">
-    <bns:encryptedValues />
-    <bns:description>{description}</bns:description>
-    <bns:object>
-        <TradingPartner classification="{classification}" standard="edifact">
-            {contact_info_xml}
-            <PartnerInfo>
-                <EdifactPartnerInfo>
+# EDIFACT trading partner component XML, filled in by build_trading_partner_xml_edifact
+_EDIFACT_TEMPLATE = _partner_template("edifact", "EdifactPartnerCommunication", '''                <EdifactPartnerInfo>
                     <EdifactOptions
                         acknowledgementoption="donotackitem"
                         compositeDelimiter="colondelimited"
@@ -295,97 +328,56 @@ def build_trading_partner_xml_edifact(
                             version="D" />
                     </EdifactControlInfo>
                 </EdifactPartnerInfo>
-            </PartnerInfo>
-            <PartnerCommunication>
-                <EdifactPartnerCommunication>
-                    <CommunicationOptions />
-                </EdifactPartnerCommunication>
-            </PartnerCommunication>
-            <DocumentTypes />
-            <Archiving />
-        </TradingPartner>
-    </bns:object>
-    <bns:processOverrides />
-</bns:Component>'''
+''')
 
 
-def build_trading_partner_xml_hl7(
+@_render_cache
+def build_trading_partner_xml_edifact(
     name: str,
     folder_name: str = "Home",
     description: str = "",
     classification: str = "mytradingpartner",
-    # HL7 parameters
-    sending_application: str = "",
-    sending_facility: str = "",
-    receiving_application: str = "",
-    receiving_facility: str = "",
+    # UNB parameters
+    unb_interchangeid: str = "",
+    unb_interchangeidqual: str = "14",
+    unb_partnerid: str = "",
+    unb_partneridqual: str = "14",
+    unb_testindicator: str = "1",
     # ContactInfo parameters
     contact_name: str = "",
     contact_email: str = "",
     contact_phone: str = "",
+    contact_fax: str = "",
     contact_address: str = "",
+    contact_address2: str = "",
     contact_city: str = "",
     contact_state: str = "",
     contact_country: str = "",
     contact_postalcode: str = ""
 ) -> str:
     """
-    Build HL7 trading partner component XML.
+    Build EDIFACT trading partner component XML.
 
     Args:
         name: Trading partner component name
         folder_name: Folder to create the component in
         description: Component description
         classification: Partner classification
-        sending_application: MSH-3 Sending Application
-        sending_facility: MSH-4 Sending Facility
-        receiving_application: MSH-5 Receiving Application
-        receiving_facility: MSH-6 Receiving Facility
+        unb_interchangeid: UNB interchange ID
+        unb_interchangeidqual: UNB interchange ID qualifier
+        unb_partnerid: UNB partner ID
+        unb_partneridqual: UNB partner ID qualifier
+        unb_testindicator: Test indicator (1=Production, others for test)
         contact_*: Optional contact information fields
 
     Returns:
-        XML string for creating HL7 trading partner
+        XML string for creating EDIFACT trading partner
     """
-    # Build ContactInfo XML with provided attributes
-    contact_attrs = []
-    if contact_name:
-        contact_attrs.append(f'name="{contact_name}"')
-    if contact_email:
-        contact_attrs.append(f'email="{contact_email}"')
-    if contact_phone:
-        contact_attrs.append(f'phone="{contact_phone}"')
-    if contact_fax:
-        contact_attrs.append(f'fax="{contact_fax}"')
-    if contact_address:
-        contact_attrs.append(f'address1="{contact_address}"')
-    if contact_address2:
-        contact_attrs.append(f'address2="{contact_address2}"')
-    if contact_city:
-        contact_attrs.append(f'city="{contact_city}"')
-    if contact_state:
-        contact_attrs.append(f'state="{contact_state}"')
-    if contact_country:
-        contact_attrs.append(f'country="{contact_country}"')
-    if contact_postalcode:
-        contact_attrs.append(f'postalcode="{contact_postalcode}"')
-
-    if contact_attrs:
-        contact_info_xml = f'<ContactInfo {" ".join(contact_attrs)} />'
-    else:
-        contact_info_xml = "<ContactInfo />"
+    return _render_partner_xml(_EDIFACT_TEMPLATE, locals())
 
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<bns:Component xmlns:bns="http://api.platform.boomi.com/"
-               name="{name}"
-               type="tradingpartner"
-               folderName="{folder_name}">
-    <bns:encryptedValues />
-    <bns:description>{description}</bns:description>
-    <bns:object>
-        <TradingPartner classification="{classification}" standard="hl7">
-            {contact_info_xml}
-            <PartnerInfo>
-                <HL7PartnerInfo>
+
+# HL7 trading partner component XML, filled in by build_trading_partner_xml_hl7
+_HL7_TEMPLATE = _partner_template("hl7", "HL7PartnerCommunication", '''                <HL7PartnerInfo>
                     <HL7Options
                         acceptackoption="NE"
                         batchoption="none"
@@ -418,93 +410,54 @@ def build_trading_partner_xml_hl7(
                         </MSHControlInfo>
                     </HL7ControlInfo>
                 </HL7PartnerInfo>
-            </PartnerInfo>
-            <PartnerCommunication>
-                <HL7PartnerCommunication>
-                    <CommunicationOptions />
-                </HL7PartnerCommunication>
-            </PartnerCommunication>
-            <DocumentTypes />
-            <Archiving />
-        </TradingPartner>
-    </bns:object>
-    <bns:processOverrides />
-</bns:Component>'''
+''')
 
 
-def build_trading_partner_xml_rosettanet(
+@_render_cache
+def build_trading_partner_xml_hl7(
     name: str,
     folder_name: str = "Home",
     description: str = "",
     classification: str = "mytradingpartner",
-    # RosettaNet parameters
-    duns_number: str = "",
-    global_location_number: str = "",
+    # HL7 parameters
+    sending_application: str = "",
+    sending_facility: str = "",
+    receiving_application: str = "",
+    receiving_facility: str = "",
     # ContactInfo parameters
     contact_name: str = "",
     contact_email: str = "",
     contact_phone: str = "",
+    contact_fax: str = "",
     contact_address: str = "",
+    contact_address2: str = "",
     contact_city: str = "",
     contact_state: str = "",
     contact_country: str = "",
     contact_postalcode: str = ""
 ) -> str:
     """
-    Build RosettaNet trading partner component XML.
+    Build HL7 trading partner component XML.
 
     Args:
         name: Trading partner component name
         folder_name: Folder to create the component in
         description: Component description
         classification: Partner classification
-        duns_number: DUNS number for the partner
-        global_location_number: GLN (Global Location Number)
+        sending_application: MSH-3 Sending Application
+        sending_facility: MSH-4 Sending Facility
+        receiving_application: MSH-5 Receiving Application
+        receiving_facility: MSH-6 Receiving Facility
         contact_*: Optional contact information fields
 
     Returns:
-        XML string for creating RosettaNet trading partner
+        XML string for creating HL7 trading partner
     """
-    # Build ContactInfo XML with provided attributes
-    contact_attrs = []
-    if contact_name:
-        contact_attrs.append(f'name="{contact_name}"')
-    if contact_email:
-        contact_attrs.append(f'email="{contact_email}"')
-    if contact_phone:
-        contact_attrs.append(f'phone="{contact_phone}"')
-    if contact_fax:
-        contact_attrs.append(f'fax="{contact_fax}"')
-    if contact_address:
-        contact_attrs.append(f'address1="{contact_address}"')
-    if contact_address2:
-        contact_attrs.append(f'address2="{contact_address2}"')
-    if contact_city:
-        contact_attrs.append(f'city="{contact_city}"')
-    if contact_state:
-        contact_attrs.append(f'state="{contact_state}"')
-    if contact_country:
-        contact_attrs.append(f'country="{contact_country}"')
-    if contact_postalcode:
-        contact_attrs.append(f'postalcode="{contact_postalcode}"')
-
-    if contact_attrs:
-        contact_info_xml = f'<ContactInfo {" ".join(contact_attrs)} />'
-    else:
-        contact_info_xml = "<ContactInfo />"
+    return _render_partner_xml(_HL7_TEMPLATE, locals())
 
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<bns:Component xmlns:bns="http://api.platform.boomi.com/"
-               name="{name}"
-               type="tradingpartner"
-               folderName="{folder_name}">
-    <bns:encryptedValues />
-    <bns:description>{description}</bns:description>
-    <bns:object>
-        <TradingPartner classification="{classification}" standard="rosettanet">
-            {contact_info_xml}
-            <PartnerInfo>
-                <RosettaNetPartnerInfo>
+
+# RosettaNet trading partner component XML, filled in by build_trading_partner_xml_rosettanet
+_ROSETTANET_TEMPLATE = _partner_template("rosettanet", "RosettaNetPartnerCommunication", '''                <RosettaNetPartnerInfo>
                     <RosettaNetOptions
                         filtersignals="false"
                         outboundDocumentValidation="false"
@@ -521,175 +474,89 @@ def build_trading_partner_xml_rosettanet(
                         signed="false"
                         signingDigestAlg="SHA1" />
                 </RosettaNetPartnerInfo>
-            </PartnerInfo>
-            <PartnerCommunication>
-                <RosettaNetPartnerCommunication>
-                    <CommunicationOptions />
-                </RosettaNetPartnerCommunication>
-            </PartnerCommunication>
-            <DocumentTypes />
-            <Archiving />
-        </TradingPartner>
-    </bns:object>
-    <bns:processOverrides />
-</bns:Component>'''
+''')
 
 
-def build_trading_partner_xml_custom(
+@_render_cache
+def build_trading_partner_xml_rosettanet(
     name: str,
     folder_name: str = "Home",
     description: str = "",
     classification: str = "mytradingpartner",
+    # RosettaNet parameters
+    duns_number: str = "",
+    global_location_number: str = "",
     # ContactInfo parameters
     contact_name: str = "",
     contact_email: str = "",
     contact_phone: str = "",
+    contact_fax: str = "",
     contact_address: str = "",
+    contact_address2: str = "",
     contact_city: str = "",
     contact_state: str = "",
     contact_country: str = "",
     contact_postalcode: str = ""
 ) -> str:
     """
-    Build custom standard trading partner component XML.
+    Build RosettaNet trading partner component XML.
 
     Args:
         name: Trading partner component name
         folder_name: Folder to create the component in
         description: Component description
         classification: Partner classification
+        duns_number: DUNS number for the partner
+        global_location_number: GLN (Global Location Number)
         contact_*: Optional contact information fields
 
     Returns:
-        XML string for creating custom trading partner
+        XML string for creating RosettaNet trading partner
     """
-    # Build ContactInfo XML with provided attributes
-    contact_attrs = []
-    if contact_name:
-        contact_attrs.append(f'name="{contact_name}"')
-    if contact_email:
-        contact_attrs.append(f'email="{contact_email}"')
-    if contact_phone:
-        contact_attrs.append(f'phone="{contact_phone}"')
-    if contact_fax:
-        contact_attrs.append(f'fax="{contact_fax}"')
-    if contact_address:
-        contact_attrs.append(f'address1="{contact_address}"')
-    if contact_address2:
-        contact_attrs.append(f'address2="{contact_address2}"')
-    if contact_city:
-        contact_attrs.append(f'city="{contact_city}"')
-    if contact_state:
-        contact_attrs.append(f'state="{contact_state}"')
-    if contact_country:
-        contact_attrs.append(f'country="{contact_country}"')
-    if contact_postalcode:
-        contact_attrs.append(f'postalcode="{contact_postalcode}"')
-
-    if contact_attrs:
-        contact_info_xml = f'<ContactInfo {" ".join(contact_attrs)} />'
-    else:
-        contact_info_xml = "<ContactInfo />"
+    return _render_partner_xml(_ROSETTANET_TEMPLATE, locals())
 
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<bns:Component xmlns:bns="http://api.platform.boomi.com/"
-               name="{name}"
-               type="tradingpartner"
-               folderName="{folder_name}">
-    <bns:encryptedValues />
-    <bns:description>{description}</bns:description>
-    <bns:object>
-        <TradingPartner classification="{classification}" standard="edicustom">
-            {contact_info_xml}
-            <PartnerInfo>
-                <CustomPartnerInfo />
-            </PartnerInfo>
-            <PartnerCommunication>
-                <CustomPartnerCommunication>
-                    <CommunicationOptions />
-                </CustomPartnerCommunication>
-            </PartnerCommunication>
-            <DocumentTypes />
-            <Archiving />
-        </TradingPartner>
-    </bns:object>
-    <bns:processOverrides />
-</bns:Component>'''
 
+# custom standard trading partner component XML, filled in by build_trading_partner_xml_custom
+_CUSTOM_TEMPLATE = _partner_template("edicustom", "CustomPartnerCommunication", '''                <CustomPartnerInfo />
+''')
 
-def build_trading_partner_xml_tradacoms(
+
+@_render_cache
+def build_trading_partner_xml_custom(
     name: str,
     folder_name: str = "Home",
     description: str = "",
     classification: str = "mytradingpartner",
-    # TRADACOMS parameters
-    sender_code: str = "",
-    recipient_code: str = "",
     # ContactInfo parameters
     contact_name: str = "",
     contact_email: str = "",
     contact_phone: str = "",
+    contact_fax: str = "",
     contact_address: str = "",
+    contact_address2: str = "",
     contact_city: str = "",
     contact_state: str = "",
     contact_country: str = "",
     contact_postalcode: str = ""
 ) -> str:
     """
-    Build TRADACOMS trading partner component XML.
+    Build custom standard trading partner component XML.
 
     Args:
         name: Trading partner component name
         folder_name: Folder to create the component in
         description: Component description
         classification: Partner classification
-        sender_code: TRADACOMS sender code
-        recipient_code: TRADACOMS recipient code
         contact_*: Optional contact information fields
 
     Returns:
-        XML string for creating TRADACOMS trading partner
+        XML string for creating custom trading partner
     """
-    # Build ContactInfo XML with provided attributes
-    contact_attrs = []
-    if contact_name:
-        contact_attrs.append(f'name="{contact_name}"')
-    if contact_email:
-        contact_attrs.append(f'email="{contact_email}"')
-    if contact_phone:
-        contact_attrs.append(f'phone="{contact_phone}"')
-    if contact_fax:
-        contact_attrs.append(f'fax="{contact_fax}"')
-    if contact_address:
-        contact_attrs.append(f'address1="{contact_address}"')
-    if contact_address2:
-        contact_attrs.append(f'address2="{contact_address2}"')
-    if contact_city:
-        contact_attrs.append(f'city="{contact_city}"')
-    if contact_state:
-        contact_attrs.append(f'state="{contact_state}"')
-    if contact_country:
-        contact_attrs.append(f'country="{contact_country}"')
-    if contact_postalcode:
-        contact_attrs.append(f'postalcode="{contact_postalcode}"')
-
-    if contact_attrs:
-        contact_info_xml = f'<ContactInfo {" ".join(contact_attrs)} />'
-    else:
-        contact_info_xml = "<ContactInfo />"
+    return _render_partner_xml(_CUSTOM_TEMPLATE, locals())
 
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<bns:Component xmlns:bns="http://api.platform.boomi.com/"
-               name="{name}"
-               type="tradingpartner"
-               folderName="{folder_name}">
-    <bns:encryptedValues />
-    <bns:description>{description}</bns:description>
-    <bns:object>
-        <TradingPartner classification="{classification}" standard="tradacoms">
-            {contact_info_xml}
-            <PartnerInfo>
-                <TradacomsPartnerInfo>
+
+# TRADACOMS trading partner component XML, filled in by build_trading_partner_xml_tradacoms
+_TRADACOMS_TEMPLATE = _partner_template("tradacoms", "TradacomsPartnerCommunication", '''                <TradacomsPartnerInfo>
                     <TradacomsOptions
                         compositeDelimiter="colondelimited"
                         fileDelimiter="plusdelimited"
@@ -698,93 +565,50 @@ def build_trading_partner_xml_tradacoms(
                         <STXControlInfo />
                     </TradacomsControlInfo>
                 </TradacomsPartnerInfo>
-            </PartnerInfo>
-            <PartnerCommunication>
-                <TradacomsPartnerCommunication>
-                    <CommunicationOptions />
-                </TradacomsPartnerCommunication>
-            </PartnerCommunication>
-            <DocumentTypes />
-            <Archiving />
-        </TradingPartner>
-    </bns:object>
-    <bns:processOverrides />
-</bns:Component>'''
+''')
 
 
-def build_trading_partner_xml_odette(
+@_render_cache
+def build_trading_partner_xml_tradacoms(
     name: str,
     folder_name: str = "Home",
     description: str = "",
     classification: str = "mytradingpartner",
-    # ODETTE parameters
-    originator_code: str = "",
-    destination_code: str = "",
+    # TRADACOMS parameters
+    sender_code: str = "",
+    recipient_code: str = "",
     # ContactInfo parameters
     contact_name: str = "",
     contact_email: str = "",
     contact_phone: str = "",
+    contact_fax: str = "",
     contact_address: str = "",
+    contact_address2: str = "",
     contact_city: str = "",
     contact_state: str = "",
     contact_country: str = "",
     contact_postalcode: str = ""
 ) -> str:
     """
-    Build ODETTE trading partner component XML.
+    Build TRADACOMS trading partner component XML.
 
     Args:
         name: Trading partner component name
         folder_name: Folder to create the component in
         description: Component description
         classification: Partner classification
-        originator_code: ODETTE originator code
-        destination_code: ODETTE destination code
+        sender_code: TRADACOMS sender code
+        recipient_code: TRADACOMS recipient code
         contact_*: Optional contact information fields
 
     Returns:
-        XML string for creating ODETTE trading partner
+        XML string for creating TRADACOMS trading partner
     """
-    # Build ContactInfo XML with provided attributes
-    contact_attrs = []
-    if contact_name:
-        contact_attrs.append(f'name="{contact_name}"')
-    if contact_email:
-        contact_attrs.append(f'email="{contact_email}"')
-    if contact_phone:
-        contact_attrs.append(f'phone="{contact_phone}"')
-    if contact_fax:
-        contact_attrs.append(f'fax="{contact_fax}"')
-    if contact_address:
-        contact_attrs.append(f'address1="{contact_address}"')
-    if contact_address2:
-        contact_attrs.append(f'address2="{contact_address2}"')
-    if contact_city:
-        contact_attrs.append(f'city="{contact_city}"')
-    if contact_state:
-        contact_attrs.append(f'state="{contact_state}"')
-    if contact_country:
-        contact_attrs.append(f'country="{contact_country}"')
-    if contact_postalcode:
-        contact_attrs.append(f'postalcode="{contact_postalcode}"')
-
-    if contact_attrs:
-        contact_info_xml = f'<ContactInfo {" ".join(contact_attrs)} />'
-    else:
-        contact_info_xml = "<ContactInfo />"
+    return _render_partner_xml(_TRADACOMS_TEMPLATE, locals())
 
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<bns:Component xmlns:bns="http://api.platform.boomi.com/"
-               name="{name}"
-               type="tradingpartner"
-               folderName="{folder_name}">
-    <bns:encryptedValues />
-    <bns:description>{description}</bns:description>
-    <bns:object>
-        <TradingPartner classification="{classification}" standard="odette">
-            {contact_info_xml}
-            <PartnerInfo>
-                <OdettePartnerInfo>
+
+# ODETTE trading partner component XML, filled in by build_trading_partner_xml_odette
+_ODETTE_TEMPLATE = _partner_template("odette", "OdettePartnerCommunication", '''                <OdettePartnerInfo>
                     <OdetteOptions
                         acknowledgementoption="donotackitem"
                         compositeDelimiter="colondelimited"
@@ -810,18 +634,121 @@ def build_trading_partner_xml_odette(
                             version="D" />
                     </OdetteControlInfo>
                 </OdettePartnerInfo>
-            </PartnerInfo>
-            <PartnerCommunication>
-                <OdettePartnerCommunication>
-                    <CommunicationOptions />
-                </OdettePartnerCommunication>
-            </PartnerCommunication>
-            <DocumentTypes />
-            <Archiving />
-        </TradingPartner>
-    </bns:object>
-    <bns:processOverrides />
-</bns:Component>'''
+''')
+
+
+@_render_cache
+def build_trading_partner_xml_odette(
+    name: str,
+    folder_name: str = "Home",
+    description: str = "",
+    classification: str = "mytradingpartner",
+    # ODETTE parameters
+    originator_code: str = "",
+    destination_code: str = "",
+    # ContactInfo parameters
+    contact_name: str = "",
+    contact_email: str = "",
+    contact_phone: str = "",
+    contact_fax: str = "",
+    contact_address: str = "",
+    contact_address2: str = "",
+    contact_city: str = "",
+    contact_state: str = "",
+    contact_country: str = "",
+    contact_postalcode: str = ""
+) -> str:
+    """
+    Build ODETTE trading partner component XML.
+
+    Args:
+        name: Trading partner component name
+        folder_name: Folder to create the component in
+        description: Component description
+        classification: Partner classification
+        originator_code: ODETTE originator code
+        destination_code: ODETTE destination code
+        contact_*: Optional contact information fields
+
+    Returns:
+        XML string for creating ODETTE trading partner
+    """
+    return _render_partner_xml(_ODETTE_TEMPLATE, locals())
+
+
+# (request contact_info key, builder parameter) pairs
+_CONTACT_INFO_KEYS = (
+    ("name", "contact_name"),
+    ("email", "contact_email"),
+    ("phone", "contact_phone"),
+    ("fax", "contact_fax"),
+    ("address", "contact_address"),
+    ("address2", "contact_address2"),
+    ("city", "contact_city"),
+    ("state", "contact_state"),
+    ("country", "contact_country"),
+    ("postal_code", "contact_postalcode"),
+)
+
+# Canonical classification values that can skip .lower()
+_LOWER_CLASSIFICATIONS = frozenset({"mytradingpartner", "tradingpartner"})
+
+# Shared read-only params for requests without contact_info
+_EMPTY_CONTACT_PARAMS: Mapping[str, str] = MappingProxyType({})
+
+# standard -> (builder, ((builder param, request_data section, section key), ...)).
+# Only keys present in the request are passed; the builder's own defaults cover the rest.
+_STANDARD_BUILDERS = {
+    "x12": (build_trading_partner_xml_x12, (
+        # X12Options
+        ("acknowledgementoption", "x12_options", "acknowledgementoption"),
+        ("envelopeoption", "x12_options", "envelopeoption"),
+        ("file_delimiter", "x12_options", "file_delimiter"),
+        ("filter_acknowledgements", "x12_options", "filter_acknowledgements"),
+        ("outbound_interchange_validation", "x12_options", "outbound_interchange_validation"),
+        ("outbound_validation_option", "x12_options", "outbound_validation_option"),
+        ("reject_duplicate_interchange", "x12_options", "reject_duplicate_interchange"),
+        ("segment_char", "x12_options", "segment_char"),
+        # ISAControlInfo
+        ("isa_ackrequested", "partner_info", "isa_ackrequested"),
+        ("isa_authorinfoqual", "partner_info", "isa_authorinfoqual"),
+        ("isa_interchangeid", "partner_info", "isa_id"),
+        ("isa_interchangeidqual", "partner_info", "isa_qualifier"),
+        ("isa_securityinfoqual", "partner_info", "isa_securityinfoqual"),
+        ("isa_testindicator", "partner_info", "isa_testindicator"),
+        # GSControlInfo
+        ("gs_respagencycode", "partner_info", "gs_respagencycode"),
+    )),
+    "edifact": (build_trading_partner_xml_edifact, (
+        ("unb_interchangeid", "partner_info", "unb_id"),
+        ("unb_interchangeidqual", "partner_info", "unb_qualifier"),
+        ("unb_partnerid", "partner_info", "unb_partner_id"),
+        ("unb_partneridqual", "partner_info", "unb_partner_qualifier"),
+        ("unb_testindicator", "partner_info", "unb_testindicator"),
+    )),
+    "hl7": (build_trading_partner_xml_hl7, (
+        ("sending_application", "partner_info", "sending_application"),
+        ("sending_facility", "partner_info", "sending_facility"),
+        ("receiving_application", "partner_info", "receiving_application"),
+        ("receiving_facility", "partner_info", "receiving_facility"),
+    )),
+    "rosettanet": (build_trading_partner_xml_rosettanet, (
+        ("duns_number", "partner_info", "duns"),
+        ("global_location_number", "partner_info", "gln"),
+    )),
+    "custom": (build_trading_partner_xml_custom, ()),
+    "tradacoms": (build_trading_partner_xml_tradacoms, (
+        ("sender_code", "partner_info", "sender_code"),
+        ("recipient_code", "partner_info", "recipient_code"),
+    )),
+    "odette": (build_trading_partner_xml_odette, (
+        ("originator_code", "partner_info", "originator_code"),
+        ("destination_code", "partner_info", "destination_code"),
+    )),
+}
+
+# Suffix for the unsupported-standard error
+_SUPPORTED_STANDARDS_MSG = f"Supported: {', '.join(_STANDARD_BUILDERS)}"
 
 
 def build_trading_partner_xml(request_data: Dict[str, Any]) -> str:
@@ -837,141 +764,60 @@ def build_trading_partner_xml(request_data: Dict[str, Any]) -> str:
     Raises:
         ValueError: If standard is not supported
     """
-    standard = request_data.get("standard", "x12").lower()
+    standard = request_data.get("standard", "x12")
+    if not standard.islower():
+        standard = standard.lower()
     name = request_data.get("component_name")
     folder_name = request_data.get("folder_name", "Home")
     description = request_data.get("description", "Trading partner created via MCP")
-    classification = request_data.get("classification", "mytradingpartner").lower()
+    classification = request_data.get("classification", "mytradingpartner")
+    if classification not in _LOWER_CLASSIFICATIONS:
+        classification = classification.lower()
 
     # Extract contact info if provided
-    contact_info = request_data.get("contact_info", {})
-    contact_params = {
-        "contact_name": contact_info.get("name", ""),
-        "contact_email": contact_info.get("email", ""),
-        "contact_phone": contact_info.get("phone", ""),
-        "contact_fax": contact_info.get("fax", ""),
-        "contact_address": contact_info.get("address", ""),
-        "contact_address2": contact_info.get("address2", ""),
-        "contact_city": contact_info.get("city", ""),
-        "contact_state": contact_info.get("state", ""),
-        "contact_country": contact_info.get("country", ""),
-        "contact_postalcode": contact_info.get("postal_code", "")
-    }
+    contact_info = request_data.get("contact_info")
+    if contact_info:
+        contact_params = {
+            param: contact_info[key] for key, param in _CONTACT_INFO_KEYS if key in contact_info
+        }
+    else:
+        contact_params = _EMPTY_CONTACT_PARAMS
 
     # Route to appropriate builder based on standard
-    if standard == "x12":
-        partner_info = request_data.get("partner_info", {})
-        x12_options = request_data.get("x12_options", {})
-
-        return build_trading_partner_xml_x12(
-            name=name,
-            folder_name=folder_name,
-            description=description,
-            classification=classification,
-            # X12Options
-            acknowledgementoption=x12_options.get("acknowledgementoption", "donotackitem"),
-            envelopeoption=x12_options.get("envelopeoption", "groupall"),
-            file_delimiter=x12_options.get("file_delimiter", "stardelimited"),
-            filter_acknowledgements=x12_options.get("filter_acknowledgements", "false"),
-            outbound_interchange_validation=x12_options.get("outbound_interchange_validation", "false"),
-            outbound_validation_option=x12_options.get("outbound_validation_option", "filterError"),
-            reject_duplicate_interchange=x12_options.get("reject_duplicate_interchange", "false"),
-            segment_char=x12_options.get("segment_char", "newline"),
-            # ISAControlInfo
-            isa_ackrequested=partner_info.get("isa_ackrequested", "false"),
-            isa_authorinfoqual=partner_info.get("isa_authorinfoqual", "00"),
-            isa_interchangeid=partner_info.get("isa_id", ""),
-            isa_interchangeidqual=partner_info.get("isa_qualifier", "01"),
-            isa_securityinfoqual=partner_info.get("isa_securityinfoqual", "00"),
-            isa_testindicator=partner_info.get("isa_testindicator", "P"),
-            # GSControlInfo
-            gs_respagencycode=partner_info.get("gs_respagencycode", "T"),
-            # ContactInfo
-            **contact_params
-        )
-
-    elif standard == "edifact":
-        partner_info = request_data.get("partner_info", {})
-        return build_trading_partner_xml_edifact(
-            name=name,
-            folder_name=folder_name,
-            description=description,
-            classification=classification,
-            unb_interchangeid=partner_info.get("unb_id", ""),
-            unb_interchangeidqual=partner_info.get("unb_qualifier", "14"),
-            unb_partnerid=partner_info.get("unb_partner_id", ""),
-            unb_partneridqual=partner_info.get("unb_partner_qualifier", "14"),
-            unb_testindicator=partner_info.get("unb_testindicator", "1"),
-            **contact_params
-        )
-
-    elif standard == "hl7":
-        partner_info = request_data.get("partner_info", {})
-        return build_trading_partner_xml_hl7(
-            name=name,
-            folder_name=folder_name,
-            description=description,
-            classification=classification,
-            sending_application=partner_info.get("sending_application", ""),
-            sending_facility=partner_info.get("sending_facility", ""),
-            receiving_application=partner_info.get("receiving_application", ""),
-            receiving_facility=partner_info.get("receiving_facility", ""),
-            **contact_params
-        )
-
-    elif standard == "rosettanet":
-        partner_info = request_data.get("partner_info", {})
-        return build_trading_partner_xml_rosettanet(
-            name=name,
-            folder_name=folder_name,
-            description=description,
-            classification=classification,
-            duns_number=partner_info.get("duns", ""),
-            global_location_number=partner_info.get("gln", ""),
-            **contact_params
-        )
-
-    elif standard == "custom":
-        return build_trading_partner_xml_custom(
-            name=name,
-            folder_name=folder_name,
-            description=description,
-            classification=classification,
-            **contact_params
-        )
-
-    elif standard == "tradacoms":
-        partner_info = request_data.get("partner_info", {})
-        return build_trading_partner_xml_tradacoms(
-            name=name,
-            folder_name=folder_name,
-            description=description,
-            classification=classification,
-            sender_code=partner_info.get("sender_code", ""),
-            recipient_code=partner_info.get("recipient_code", ""),
-            **contact_params
-        )
-
-    elif standard == "odette":
-        partner_info = request_data.get("partner_info", {})
-        return build_trading_partner_xml_odette(
-            name=name,
-            folder_name=folder_name,
-            description=description,
-            classification=classification,
-            originator_code=partner_info.get("originator_code", ""),
-            destination_code=partner_info.get("destination_code", ""),
-            **contact_params
-        )
-
-    else:
-        raise ValueError(f"Unsupported trading partner standard: {standard}. Supported: x12, edifact, hl7, rosettanet, custom, tradacoms, odette")
+    try:
+        builder, standard_fields = _STANDARD_BUILDERS[standard]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported trading partner standard: {standard}. {_SUPPORTED_STANDARDS_MSG}"
+        ) from None
+
+    sections = {
+        "partner_info": request_data.get("partner_info") or {},
+        "x12_options": request_data.get("x12_options") or {},
+    }
+    standard_params = {
+        param: sections[section][key]
+        for param, section, key in standard_fields
+        if key in sections[section]
+    }
+    return builder(
+        name=name,
+        folder_name=folder_name,
+        description=description,
+        classification=classification,
+        **standard_params,
+        **contact_params
+    )
 
 
 # ============================================================================
 # Trading Partner CRUD Operations
 # ============================================================================
 
+# Standards always reported in the list_trading_partners summary
+_SUMMARY_STANDARDS = ('x12', 'edifact', 'hl7', 'custom', 'rosettanet', 'tradacoms', 'odette')
+
+
 def create_trading_partner(boomi_client, profile: str, request_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a new trading partner component in Boomi using XML-based Component API.
@@ -989,7 +835,7 @@ def create_trading_partner(boomi_client, profile: str, request_data: Dict[str, A
             - classification: Classification type (default: mytradingpartner)
             - folder_name: Folder name (default: Home)
             - description: Component description (optional)
-            - contact_info: Optional contact information dict with: name, email, phone, address, city, state, country, postal_code
+            - contact_info: Optional contact information dict with: name, email, phone, fax, address, address2, city, state, country, postal_code
             - partner_info: Partner-specific information dict (standard-dependent):
                 - X12: isa_id, isa_qualifier, isa_ackrequested, isa_authorinfoqual, isa_securityinfoqual, isa_testindicator, gs_respagencycode
                 - EDIFACT: unb_id, unb_qualifier, unb_partner_id, unb_partner_qualifier, unb_testindicator
@@ -1088,8 +934,6 @@ def get_trading_partner(boomi_client, profile: str, component_id: str) -> Dict[s
         Trading partner details or error
     """
     try:
-        import xml.etree.ElementTree as ET
-
         # Use id_ parameter as shown in SDK example
         # If ContactInfo parsing fails, fall back to Component API
         used_component_api = False
@@ -1116,42 +960,20 @@ def get_trading_partner(boomi_client, profile: str, component_id: str) -> Dict[s
         else:
             retrieved_id = component_id
 
-        # If we used Component API, parse XML to extract additional fields
+        # If we used Component API, parse the XML once for standard,
+        # classification and ContactInfo
         standard = None
         classification = None
+        contact_info = {}
         if used_component_api:
             try:
-                xml_str = result.to_xml()
-                root = ET.fromstring(xml_str)
+                root = ET.fromstring(result.to_xml())
 
                 # Extract standard and classification from TradingPartner element
                 trading_partner = root.find('.//TradingPartner')
                 if trading_partner is not None:
                     standard = trading_partner.get('standard')
                     classification = trading_partner.get('classification')
-            except Exception as xml_error:
-                # If XML parsing fails, just continue without these fields
-                pass
-
-        # Extract partner details
-        partner_info = {}
-        if hasattr(result, 'PartnerInfo'):
-            info = result.PartnerInfo
-            partner_info = {
-                "isa_id": getattr(info, 'ISAId', None),
-                "isa_qualifier": getattr(info, 'ISAQualifier', None),
-                "gs_id": getattr(info, 'GSId', None),
-                "unb_id": getattr(info, 'UNBId', None),
-                "unb_qualifier": getattr(info, 'UNBQualifier', None),
-                "duns": getattr(info, 'DUNS', None)
-            }
-
-        contact_info = {}
-        # If we used Component API, parse ContactInfo from XML
-        if used_component_api:
-            try:
-                xml_str = result.to_xml()
-                root = ET.fromstring(xml_str)
 
                 # Find ContactInfo element
                 contact_elem = root.find('.//ContactInfo')
@@ -1171,7 +993,7 @@ def get_trading_partner(boomi_client, profile: str, component_id: str) -> Dict[s
                     # Remove None values
                     contact_info = {k: v for k, v in contact_info.items() if v is not None}
             except Exception as xml_error:
-                # If XML parsing fails, just continue without contact info
+                # If XML parsing fails, just continue without these fields
                 pass
         else:
             # Use object attributes if available (trading_partner_component API)
@@ -1192,6 +1014,19 @@ def get_trading_partner(boomi_client, profile: str, component_id: str) -> Dict[s
                         "fax": getattr(contact, 'fax', None)
                     }
 
+        # Extract partner details
+        partner_info = {}
+        if hasattr(result, 'PartnerInfo'):
+            info = result.PartnerInfo
+            partner_info = {
+                "isa_id": getattr(info, 'ISAId', None),
+                "isa_qualifier": getattr(info, 'ISAQualifier', None),
+                "gs_id": getattr(info, 'GSId', None),
+                "unb_id": getattr(info, 'UNBId', None),
+                "unb_qualifier": getattr(info, 'UNBQualifier', None),
+                "duns": getattr(info, 'DUNS', None)
+            }
+
         return {
             "_success": True,
             "trading_partner": {
@@ -1295,7 +1130,9 @@ def list_trading_partners(boomi_client, profile: str, filters: Optional[Dict[str
             request_body=query_config
         )
 
+        # Build partner list and per-standard grouping in one pass
         partners = []
+        grouped = defaultdict(list)
         if hasattr(result, 'result') and result.result:
             for partner in result.result:
                 # Extract ID using SDK pattern (id_ attribute)
@@ -1307,38 +1144,29 @@ def list_trading_partners(boomi_client, profile: str, filters: Optional[Dict[str
                 elif hasattr(partner, 'component_id'):
                     partner_id = partner.component_id
 
-                partners.append({
+                partner_entry = {
                     "component_id": partner_id,
                     "name": getattr(partner, 'name', getattr(partner, 'component_name', None)),
                     "standard": getattr(partner, 'standard', None),
                     "classification": getattr(partner, 'classification', None),
                     "folder_name": getattr(partner, 'folder_name', None),
                     "deleted": getattr(partner, 'deleted', False)
-                })
+                }
+                partners.append(partner_entry)
 
-        # Group partners by standard
-        grouped = {}
-        for partner in partners:
-            standard = partner.get("standard", "unknown")
-            if standard:
-                standard_upper = standard.upper()
-                if standard_upper not in grouped:
-                    grouped[standard_upper] = []
-                grouped[standard_upper].append(partner)
+                # Group partners by standard
+                standard = partner_entry["standard"]
+                if standard:
+                    grouped[standard.upper()].append(partner_entry)
 
         return {
             "_success": True,
             "total_count": len(partners),
             "partners": partners,
-            "by_standard": grouped,
+            "by_standard": dict(grouped),
             "summary": {
-                "x12": len(grouped.get("X12", [])),
-                "edifact": len(grouped.get("EDIFACT", [])),
-                "hl7": len(grouped.get("HL7", [])),
-                "custom": len(grouped.get("CUSTOM", [])),
-                "rosettanet": len(grouped.get("ROSETTANET", [])),
-                "tradacoms": len(grouped.get("TRADACOMS", [])),
-                "odette": len(grouped.get("ODETTE", []))
+                standard: len(grouped.get(standard.upper(), ()))
+                for standard in _SUMMARY_STANDARDS
             }
         }
 
@@ -1370,8 +1198,6 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
         Updated trading partner details or error
     """
     try:
-        import xml.etree.ElementTree as ET
-
         # Step 1: Get the existing component using Component API (not trading_partner_component)
         component = boomi_client.component.get_component(component_id=component_id)
 
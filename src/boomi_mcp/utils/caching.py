@@ -8,6 +8,7 @@ Particularly useful for component dependency analysis and repeated queries.
 from datetime import datetime, timedelta
 from typing import Any, Optional, Dict, Callable
 from functools import wraps
+import threading
 
 
 class ComponentCache:
@@ -93,7 +94,7 @@ class GenericCache:
     Generic TTL-based cache for any data.
 
     More flexible than ComponentCache, can be used for
-    any cacheable operation.
+    any cacheable operation. Safe to share between threads.
     """
 
     def __init__(self, ttl_seconds: int = 300, max_size: int = 1000):
@@ -108,6 +109,7 @@ class GenericCache:
         self._ttl = ttl_seconds
         self._max_size = max_size
         self._access_order: Dict[str, datetime] = {}
+        self._lock = threading.RLock()
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -119,20 +121,21 @@ class GenericCache:
         Returns:
             Cached data if valid, None otherwise
         """
-        if key not in self._cache:
-            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
 
-        entry = self._cache[key]
-        age = datetime.now() - entry["timestamp"]
+            age = datetime.now() - entry["timestamp"]
 
-        if age < timedelta(seconds=self._ttl):
-            # Update access time for LRU
-            self._access_order[key] = datetime.now()
-            return entry["data"]
+            if age < timedelta(seconds=self._ttl):
+                # Update access time for LRU
+                self._access_order[key] = datetime.now()
+                return entry["data"]
 
-        # Expired
-        self._evict(key)
-        return None
+            # Expired
+            self._evict(key)
+            return None
 
     def set(self, key: str, data: Any) -> None:
         """
@@ -142,16 +145,32 @@ class GenericCache:
             key: Cache key
             data: Data to cache
         """
-        # Evict if at capacity
-        if len(self._cache) >= self._max_size and key not in self._cache:
-            self._evict_lru()
+        with self._lock:
+            # Evict if at capacity
+            if len(self._cache) >= self._max_size and key not in self._cache:
+                self._evict_lru()
+
+            now = datetime.now()
+            self._cache[key] = {
+                "data": data,
+                "timestamp": now
+            }
+            self._access_order[key] = now
 
-        now = datetime.now()
-        self._cache[key] = {
-            "data": data,
-            "timestamp": now
-        }
-        self._access_order[key] = now
+    def remove(self, key: str) -> bool:
+        """
+        Remove specific key from cache.
+
+        Args:
+            key: Cache key to remove
+
+        Returns:
+            True if key was found and removed
+        """
+        with self._lock:
+            found = key in self._cache
+            self._evict(key)
+            return found
 
     def _evict(self, key: str) -> None:
         """Remove specific key from cache."""
@@ -171,8 +190,9 @@ class GenericCache:
 
     def clear(self) -> None:
         """Clear all cached data."""
-        self._cache.clear()
-        self._access_order.clear()
+        with self._lock:
+            self._cache.clear()
+            self._access_order.clear()
 
     def size(self) -> int:
         """Get number of cached items."""